@@ -20,6 +20,8 @@ class AttackerProfile:
     Represents an attacker persona.
     """
 
+    __slots__ = ("id", "skill_level", "motivation", "patience", "created_at")
+
     def __init__(self, skill_level, motivation, patience):
         self.id = str(uuid.uuid4())
         self.skill_level = skill_level        # low / medium / high / nation-state
@@ -42,6 +44,8 @@ class AttackHypothesis:
     Represents a possible attack path that may or may not happen.
     """
 
+    __slots__ = ("vector", "confidence", "reasoning", "generated_at")
+
     def __init__(self, vector, confidence, reasoning):
         self.vector = vector                  # phishing, credential abuse, lateral move
         self.confidence = confidence          # probability score
@@ -11,14 +11,21 @@ Core philosophy:
 """
 
 import uuid
+from collections import Counter
 from datetime import datetime
 
+from utils.clock import now_iso
+
 
 class DefenderJudgement:
     """
     Represents a single defensive decision with reasoning, doubt, and consequences.
     """
 
+    __slots__ = (
+        "id", "action", "confidence", "reasoning", "ignored_signals", "created_at"
+    )
+
     def __init__(self, action, confidence, reasoning, ignored_signals):
         self.id = str(uuid.uuid4())
         self.action = action                      # investigate / contain / ignore / observe
@@ -46,6 +53,7 @@ class DefenderBrain:
 
     def __init__(self):
         self.decisions = []
+        self.action_counts = Counter()  # Kept in step with decisions
         self.regret_memory = []       # Tracks decisions that aged badly
         self.trust_baseline = 0.5     # How much the system trusts itself
 
@@ -81,6 +89,7 @@ class DefenderBrain:
         )
 
         self.decisions.append(decision)
+        self.action_counts[action] += 1
         return decision.explain()
 
     def self_critique(self):
@@ -111,7 +120,7 @@ class DefenderBrain:
         regret = {
             "decision_id": decision_id,
             "outcome": outcome,
-            "recorded_at": datetime.utcnow().isoformat()
+            "recorded_at": now_iso()
         }
         self.regret_memory.append(regret)
 
@@ -125,7 +134,7 @@ class DefenderBrain:
         if not self.decisions:
             return "Insufficient data to predict defender failure."
 
-        ignore_count = sum(1 for d in self.decisions if d.action == "ignore")
+        ignore_count = self.action_counts["ignore"]
 
         if ignore_count > len(self.decisions) * 0.4:
             return (
@@ -10,15 +10,22 @@ Core beliefs:
 - Future risk is measurable
 """
 
+from collections import deque
 from datetime import datetime, timedelta
 import uuid
 
 
+DECAY_WINDOW = timedelta(days=14)
+_DECAY_WINDOW_SECS = DECAY_WINDOW.total_seconds()
+
+
 class TemporalEvent:
     """
     Represents a security-relevant event anchored in time.
     """
 
+    __slots__ = ("id", "event_type", "severity", "description", "timestamp")
+
     def __init__(self, event_type, severity, description):
         self.id = str(uuid.uuid4())
         self.event_type = event_type
@@ -44,14 +51,47 @@ class TimeEngine:
 
     def __init__(self):
         self.timeline = []
+        self.low_severity_count = 0        # Kept in step with timeline
         self.breach_clock = 0.0            # 0.0 – 1.0 probability
         self.last_analysis = datetime.utcnow()
 
+        # Events still inside the decay window, oldest first, as parallel
+        # columns (no per-event tuple) plus running sums of severity and
+        # severity*offset so risk needs no per-event pass
+        self._anchor_time = self.last_analysis
+        self._window_offsets = deque()
+        self._window_severities = deque()
+        self._severity_sum = 0
+        self._weighted_offset_sum = 0.0
+
     def record_event(self, event_type, severity, description):
         event = TemporalEvent(event_type, severity, description)
         self.timeline.append(event)
+        if event.severity <= 4:
+            self.low_severity_count += 1
+
+        severity = event.severity
+        offset = (event.timestamp - self._anchor_time).total_seconds()
+        self._window_offsets.append(offset)
+        self._window_severities.append(severity)
+        self._severity_sum += severity
+        self._weighted_offset_sum += severity * offset
         return event.describe()
 
+    def _expire_events(self, now_offset):
+        cutoff = now_offset - _DECAY_WINDOW_SECS
+        offsets = self._window_offsets
+        severities = self._window_severities
+        while offsets and offsets[0] < cutoff:
+            offset = offsets.popleft()
+            severity = severities.popleft()
+            self._severity_sum -= severity
+            self._weighted_offset_sum -= severity * offset
+
+        if not offsets:
+            self._severity_sum = 0
+            self._weighted_offset_sum = 0.0
+
     def analyze_temporal_risk(self):
         """
         Converts timeline into future breach probability.
@@ -60,20 +100,17 @@ class TimeEngine:
             return self._no_data_forecast()
 
         now = datetime.utcnow()
-        decay_window = timedelta(days=14)
-
-        risk = 0.0
+        now_offset = (now - self._anchor_time).total_seconds()
 
-        for event in self.timeline:
-            age = now - event.timestamp
+        self._expire_events(now_offset)
 
-            if age > decay_window:
-                continue
+        # Linear decay is separable: sum(s/10 * (1 - (now - t) / W))
+        #   = (sum(s) - (now * sum(s) - sum(s * t)) / W) / 10
+        risk = (self._severity_sum - (
+            now_offset * self._severity_sum - self._weighted_offset_sum
+        ) / _DECAY_WINDOW_SECS) / 10
 
-            weight = (decay_window - age).total_seconds() / decay_window.total_seconds()
-            risk += (event.severity / 10) * weight
-
-        self.breach_clock = min(risk, 1.0)
+        self.breach_clock = min(max(risk, 0.0), 1.0)
 
         return {
             "breach_probability": round(self.breach_clock, 2),
@@ -97,11 +134,7 @@ class TimeEngine:
         """
         Detects long, low-noise attacks.
         """
-        low_severity_events = [
-            e for e in self.timeline if e.severity <= 4
-        ]
-
-        if len(low_severity_events) >= 5:
+        if self.low_severity_count >= 5:
             return {
                 "slow_attack_detected": True,
                 "description": (
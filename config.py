@@ -4,6 +4,8 @@
 # BACKWARD + FORWARD COMPATIBLE
 # =====================================================
 
+import os
+
 # ==================== TOOL METADATA ====================
 
 TOOL_NAME = "ELITE SOC ANALYZER"
@@ -47,6 +49,13 @@ GENERIC_SUSPICIOUS_THRESHOLD = 10
 ACCOUNT_IP_THRESHOLD = 3
 ACCOUNT_IP_WINDOW_MINUTES = 15
 
+# Worker processes for per-IP scoring (0/1 = in-process)
+# Only pays off on very large logs — events are pickled to workers
+ANALYSIS_WORKERS = 0
+
+# Parallel parsing kicks in above this size — below it fork/IPC dominates
+PARALLEL_PARSE_MIN_BYTES = 50 * 1024 * 1024
+
 # =====================================================
 # RISK SCORING
 # =====================================================
@@ -67,10 +76,11 @@ MAX_RISK_SCORE = 100
 
 ENABLE_GEO_CONTEXT = True
 
-GEO_RISK_COUNTRIES = [
+# frozenset: O(1) membership on the per-IP geo check
+GEO_RISK_COUNTRIES = frozenset((
     "RU", "CN", "KP", "IR", "SY",
     "AF", "IQ", "BY", "VE"
-]
+))
 
 # =====================================================
 # FALSE POSITIVE REDUCTION
@@ -103,6 +113,11 @@ THREAT_INTEL_SOURCES = {
 ABUSEIPDB_API_KEY = "YOUR_API_KEY_HERE"
 VIRUSTOTAL_API_KEY = "YOUR_API_KEY_HERE"
 
+# Live lookups are persisted here between runs (24h TTL)
+THREAT_INTEL_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "elite_soc", "ti.json"
+)
+
 # =====================================================
 # ML & HEURISTICS
 # =====================================================
@@ -146,6 +161,9 @@ ENABLE_MITRE_MATRIX = True
 ENABLE_SIEM_EXPORT = True
 ENABLE_FUTURE_REPORT = True
 
+# JSON reports are compact unless pretty output is asked for
+JSON_REPORT_PRETTY = False
+
 IOC_EXPORT_DIR = "./ioc_feeds/"
 SIEM_EXPORT_DIR = "./siem_exports/"
 
@@ -3,25 +3,35 @@
 # AUTHOR: VISHAL — SOC ENGINEERING
 # =====================================================
 
+import io
 import os
+import sys
+import time
 import hashlib
-from collections import defaultdict
-from datetime import datetime, timedelta
+from collections import defaultdict, Counter
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 import config as cfg
 
-from core.parser import LogParser
+from core.parser import LogParser, EVT_FAILED, EVT_ACCEPTED
 from intelligence.threat_intel import ThreatIntelligence
 from core.ml_engine import MLAnomalyDetector
 from core.risk_engine import (
-    calculate_risk_score,
+    calculate_auth_risk_score,
     calculate_confidence_level
 )
 from core.mitre import MITRE_ATTACK
 
 from storage.database import (
     init_db,
-    upsert_incident
+    upsert_incidents_bulk
 )
 
 from ui.ui import (
@@ -31,6 +41,188 @@ from ui.ui import (
     progress_bar
 )
 
+# MITRE mappings attached to every alert of a type — resolved once at import
+_MITRE_SSH_BF = MITRE_ATTACK.get("SSH_BRUTE_FORCE", {})
+_MITRE_SSH_BF_TACTIC = _MITRE_SSH_BF.get("TACTIC")
+_MITRE_ACCOUNT = MITRE_ATTACK.get("ACCOUNT_COMPROMISE", {})
+_MITRE_ACCOUNT_TACTIC = _MITRE_ACCOUNT.get("TACTIC")
+
+
+def refresh_mitre_cache():
+    """
+    Re-resolve the cached MITRE mappings after MITRE_ATTACK is modified
+    """
+    global _MITRE_SSH_BF, _MITRE_SSH_BF_TACTIC
+    global _MITRE_ACCOUNT, _MITRE_ACCOUNT_TACTIC
+
+    _MITRE_SSH_BF = MITRE_ATTACK.get("SSH_BRUTE_FORCE", {})
+    _MITRE_SSH_BF_TACTIC = _MITRE_SSH_BF.get("TACTIC")
+    _MITRE_ACCOUNT = MITRE_ATTACK.get("ACCOUNT_COMPROMISE", {})
+    _MITRE_ACCOUNT_TACTIC = _MITRE_ACCOUNT.get("TACTIC")
+
+
+# IP alert confidence only varies with (intel match, ml_score > 0.5)
+_IP_CONFIDENCE = {
+    (intel, ml_high): calculate_confidence_level(
+        data_quality=0.9,
+        threat_intel_match=intel,
+        behavioral_consistency=0.6 if ml_high else 1.0
+    )
+    for intel in (False, True)
+    for ml_high in (False, True)
+}
+
+# Threat level per 10-point risk bucket (risk is capped at 100)
+_THREAT_LEVELS = (
+    ("LOW",) * 4 + ("MEDIUM",) * 2 + ("HIGH",) * 2 + ("CRITICAL",) * 3
+)
+
+# =====================================================
+# COUNTING KERNEL
+# =====================================================
+
+# Day of year each month starts on (syslog stamps carry no year)
+_MONTH_START = dict(zip(
+    ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+     "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+    (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+))
+_YEAR_SECONDS = 365 * 86400
+
+
+@lru_cache(maxsize=8192)
+def _syslog_seconds(stamp):
+    """
+    'Mon DD HH:MM:SS' as (day the month starts on, seconds into the year),
+    None if unparseable
+    """
+    try:
+        month, day, clock = stamp.split()
+        h, m, s = clock.split(":")
+        start = _MONTH_START[month]
+        days = start + int(day)
+        return start, ((days * 24 + int(h)) * 60 + int(m)) * 60 + int(s)
+    except (KeyError, ValueError):
+        return None
+
+
+def _max_in_window(times, window):
+    """
+    Most timestamps falling inside any span of `window` seconds
+    """
+    times.sort()
+    best = 0
+    lo = 0
+    for hi, t in enumerate(times):
+        while t - times[lo] > window:
+            lo += 1
+        if hi - lo >= best:
+            best = hi - lo + 1
+    return best
+
+
+def _count_auth_events(events, window):
+    """
+    Single pass over an IP's events
+    - failed: most FAILED events inside any `window`-second span of the
+      log's own timestamps (ingest time for lines without one)
+    - success: ACCEPTED events regardless of age
+    """
+    success = 0
+    stamped = []
+    unstamped = []
+
+    # Syslog stamps have no year — a month earlier than the last one seen
+    # means the log rolled over into the next year
+    last_month = 0
+    year = 0
+
+    for e in events:
+        code = e.get("EVT_CODE")
+        if code == EVT_FAILED:
+            stamp = e.get("timestamp")
+            parsed = _syslog_seconds(stamp) if stamp else None
+            if parsed is None:
+                unstamped.append(e.get("INGEST_TS", 0))
+                continue
+            month, secs = parsed
+            if month < last_month:
+                year += _YEAR_SECONDS
+            last_month = month
+            stamped.append(year + secs)
+        elif code == EVT_ACCEPTED:
+            success += 1
+
+    # Log-relative seconds and epoch seconds aren't comparable — window
+    # each clock separately
+    failed = max(
+        _max_in_window(stamped, window),
+        _max_in_window(unstamped, window)
+    )
+
+    return failed, success
+
+
+def _score_ip(ml, ip, events, window):
+    failed, success = _count_auth_events(events, window)
+
+    ml_score = 0
+    if cfg.ENABLE_ML_ANOMALY_DETECTION:
+        ml_score = ml.detect_anomalies(ip, events)
+
+    return failed, success, ml_score
+
+
+# Worker-process state for ProcessPoolExecutor fan-out
+_worker_ml = None
+
+
+def _init_ip_worker(baselines):
+    global _worker_ml
+    _worker_ml = MLAnomalyDetector()
+    _worker_ml.baselines = baselines
+
+
+def _score_ip_worker(item):
+    ip, events, window = item
+    return _score_ip(_worker_ml, ip, events, window)
+
+
+_worker_parser = None
+
+
+def _init_parse_worker():
+    global _worker_parser
+    _worker_parser = LogParser()
+
+
+def _parse_chunk_worker(item):
+    """
+    Parse one newline-aligned byte range; LINE_NUMBER is chunk-relative
+    """
+    file_path, start, end = item
+    parse_line = _worker_parser.parse_line
+    events = []
+    lines = 0
+
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    for lines, raw in enumerate(io.BytesIO(data), 1):
+        parsed = parse_line(raw.decode("utf-8", "ignore"))
+        if parsed:
+            parsed["LINE_NUMBER"] = lines
+            events.append(parsed)
+
+    return events, lines
+
+
+def _event_time(event):
+    # Non-syslog lines carry no parsed timestamp — fall back to ingest time
+    return event.get("timestamp") or event.get("INGEST_TIME")
+
+
 # =====================================================
 # ANALYSIS ENGINE
 # =====================================================
@@ -65,7 +257,16 @@ class AnalysisEngine:
         # Init persistence
         init_db()
 
-        # Runtime statistics
+        # Per-engine constants reused by every alert
+        self._tool_meta = {
+            "ALERT_SOURCE": cfg.TOOL_NAME,
+            "TOOL_VERSION": cfg.TOOL_VERSION
+        }
+
+        self._reset_stats()
+
+    def _reset_stats(self):
+        # Runtime statistics — per analysis, so a reused engine starts clean
         self.stats = {
             "TOTAL_LINES": 0,
             "PARSED_EVENTS": 0,
@@ -90,6 +291,7 @@ class AnalysisEngine:
             display_error(f"FILE NOT FOUND: {file_path}")
             return []
 
+        self._reset_stats()
         self.stats["ANALYSIS_START"] = datetime.utcnow()
         display_status(f"STARTING ANALYSIS: {file_path}")
 
@@ -115,25 +317,84 @@ class AnalysisEngine:
 
     def _parse_file(self, file_path):
         events = []
+        idx = 0
+
+        # Progress is tracked in bytes so no separate line-count pass is needed
+        size = os.path.getsize(file_path)
+        source_file = sys.intern(os.path.basename(file_path))
 
-        with open(file_path, "r", errors="ignore") as f:
-            lines = f.readlines()
-            self.stats["TOTAL_LINES"] = len(lines)
+        if cfg.ANALYSIS_WORKERS > 1 and size >= cfg.PARALLEL_PARSE_MIN_BYTES:
+            return self._parse_file_parallel(file_path, size, source_file)
+        parse_line = self.parser.parse_line
 
-            for idx, line in enumerate(lines):
-                parsed = self.parser.parse_line(line)
+        # Stream line by line — never hold the whole log in memory.
+        # Binary reads skip text-mode newline translation; decode per line.
+        with open(file_path, "rb", buffering=1 << 20) as f:
+            for idx, raw in enumerate(f, 1):
+                parsed = parse_line(raw.decode("utf-8", "ignore"))
                 if parsed:
-                    parsed["LINE_NUMBER"] = idx + 1
-                    parsed["SOURCE_FILE"] = os.path.basename(file_path)
+                    parsed["LINE_NUMBER"] = idx
+                    parsed["SOURCE_FILE"] = source_file
                     events.append(parsed)
-                    self.stats["PARSED_EVENTS"] += 1
 
-                if idx % 200 == 0:
-                    progress_bar(idx, len(lines), "PARSING")
+                if idx & 0xFFF == 0:
+                    progress_bar(f.tell(), size, "PARSING")
 
-        progress_bar(len(lines), len(lines), "PARSING")
+        self.stats["TOTAL_LINES"] = idx
+        self.stats["PARSED_EVENTS"] += len(events)
+
+        progress_bar(size, size, "PARSING")
+        return events
+
+    def _parse_file_parallel(self, file_path, size, source_file):
+        """
+        Fan newline-aligned byte ranges out to worker processes.
+        Results are merged in file order with global line numbers.
+        """
+        ranges = self._chunk_ranges(file_path, size, cfg.ANALYSIS_WORKERS * 4)
+        items = [(file_path, start, end) for start, end in ranges]
+        events = []
+        base = 0
+
+        with ProcessPoolExecutor(
+            max_workers=cfg.ANALYSIS_WORKERS,
+            initializer=_init_parse_worker
+        ) as pool:
+            for (_, end), (chunk, lines) in zip(
+                ranges, pool.map(_parse_chunk_worker, items)
+            ):
+                # Unpickling hands back a fresh EVENT_TYPE string per chunk;
+                # re-interning restores identity hits in the ML counters
+                for parsed in chunk:
+                    parsed["LINE_NUMBER"] += base
+                    parsed["SOURCE_FILE"] = source_file
+                    parsed["EVENT_TYPE"] = sys.intern(parsed["EVENT_TYPE"])
+                events.extend(chunk)
+                base += lines
+                progress_bar(end, size, "PARSING")
+
+        self.stats["TOTAL_LINES"] = base
+        self.stats["PARSED_EVENTS"] += len(events)
         return events
 
+    @staticmethod
+    def _chunk_ranges(file_path, size, parts):
+        """
+        Split a file into ~equal (start, end) byte ranges on line boundaries
+        """
+        bounds = [0]
+
+        with open(file_path, "rb") as f:
+            for i in range(1, parts):
+                f.seek(size * i // parts)
+                f.readline()
+                pos = f.tell()
+                if bounds[-1] < pos < size:
+                    bounds.append(pos)
+
+        bounds.append(size)
+        return list(zip(bounds, bounds[1:]))
+
     # =====================================================
     # CORRELATION
     # =====================================================
@@ -144,49 +405,75 @@ class AnalysisEngine:
         user_map = defaultdict(list)
 
         for e in events:
-            if e.get("ip"):
-                ip_map[e["ip"]].append(e)
-            if e.get("user"):
-                user_map[e["user"]].append(e)
+            ip = e.get("ip")
+            user = e.get("user")
+            if ip:
+                ip_map[ip].append(e)
+            if user:
+                user_map[user].append(e)
+
+        # One reputation pass over every unique IP
+        reputation = self.threat_intel.check_ip_reputation_bulk(ip_map)
+        scores = self._score_ips(ip_map)
+
+        # Per-run constants — not recomputed for each group
+        window = cfg.FAILED_LOGIN_WINDOW_MINUTES * 60
+        pain_bias = self.memory.pain_index() if self.memory else 0
 
         for ip, evs in ip_map.items():
-            alerts.extend(self._analyze_ip(ip, evs))
+            threats, _ = reputation[ip]
+            ip_scores = scores.get(ip) or _score_ip(self.ml, ip, evs, window)
+            alerts.extend(
+                self._analyze_ip(ip, evs, threats, ip_scores, pain_bias)
+            )
 
         for user, evs in user_map.items():
             alerts.extend(self._analyze_user(user, evs))
 
+        # One transaction for every new incident instead of one per alert
+        upsert_incidents_bulk(alerts)
+
         return alerts
 
     # =====================================================
     # IP ANALYSIS
     # =====================================================
 
-    def _analyze_ip(self, ip, events):
+    def _score_ips(self, ip_map):
+        """
+        Per-IP (failed, success, ml_score) — CPU-only, no side effects.
+        Fans out to worker processes when ANALYSIS_WORKERS > 1.
+        """
+        if cfg.ANALYSIS_WORKERS <= 1 or len(ip_map) < 2:
+            return {}
+
+        window = cfg.FAILED_LOGIN_WINDOW_MINUTES * 60
+        items = [(ip, evs, window) for ip, evs in ip_map.items()]
+
+        with ProcessPoolExecutor(
+            max_workers=cfg.ANALYSIS_WORKERS,
+            initializer=_init_ip_worker,
+            initargs=(self.ml.baselines,)
+        ) as pool:
+            results = pool.map(_score_ip_worker, items, chunksize=64)
+            return {item[0]: res for item, res in zip(items, results)}
+
+    def _analyze_ip(self, ip, events, threats=None, scores=None, pain_bias=None):
         alerts = []
-        now = datetime.utcnow()
-        window = timedelta(minutes=cfg.FAILED_LOGIN_WINDOW_MINUTES)
-
-        recent = []
-        for e in events:
-            try:
-                if datetime.fromisoformat(e["timestamp"]) > now - window:
-                    recent.append(e)
-            except Exception:
-                continue
 
-        failed = sum(1 for e in recent if "FAILED" in e.get("event_type", ""))
-        success = sum(1 for e in events if "ACCEPTED" in e.get("event_type", ""))
+        if scores is None:
+            window = cfg.FAILED_LOGIN_WINDOW_MINUTES * 60
+            scores = _score_ip(self.ml, ip, events, window)
+        failed, success, ml_score = scores
 
-        threats, _ = self.threat_intel.check_ip_reputation(ip)
-        geo = self.threat_intel.get_geoip_info(ip)
+        if threats is None:
+            threats, _ = self.threat_intel.check_ip_reputation(ip)
 
-        ml_score = 0
-        if cfg.ENABLE_ML_ANOMALY_DETECTION:
-            ml_score = self.ml.detect_anomalies(ip, events)
-            if ml_score >= cfg.ANOMALY_THRESHOLD:
-                self.stats["ML_ANOMALIES_DETECTED"] += 1
+        if ml_score >= cfg.ANOMALY_THRESHOLD:
+            self.stats["ML_ANOMALIES_DETECTED"] += 1
 
-        pain_bias = self.memory.pain_index() if self.memory else 0
+        if pain_bias is None:
+            pain_bias = self.memory.pain_index() if self.memory else 0
 
         if cfg.ENABLE_FP_REDUCTION:
             if success >= cfg.FP_SUCCESSFUL_LOGIN_THRESHOLD and \
@@ -196,21 +483,18 @@ class AnalysisEngine:
                 return alerts
 
         if failed >= cfg.FAILED_LOGIN_THRESHOLD:
-            risk = calculate_risk_score(
-                failed_attempts=failed,
-                geo_risk=geo.get("COUNTRY") in cfg.GEO_RISK_COUNTRIES,
-                threat_intel=bool(threats),
-                ml_anomaly_score=ml_score
+            geo = self.threat_intel.get_geoip_info(ip)
+            risk = calculate_auth_risk_score(
+                failed,
+                geo.get("COUNTRY") in cfg.GEO_RISK_COUNTRIES,
+                bool(threats),
+                ml_score
             )
 
-            confidence = calculate_confidence_level(
-                data_quality=0.9,
-                threat_intel_match=bool(threats),
-                behavioral_consistency=0.6 if ml_score > 0.5 else 1.0
-            )
-
-            mitre = MITRE_ATTACK.get("SSH_BRUTE_FORCE", {})
+            confidence = _IP_CONFIDENCE[(bool(threats), ml_score > 0.5)]
 
+            # Alerts stay plain dicts: exporters, the dashboard and the
+            # incident DB read and extend them as open-ended mappings
             alert = {
                 "ALERT_ID": self._alert_id(ip),
                 "INCIDENT_STATE": "OPEN",
@@ -224,15 +508,13 @@ class AnalysisEngine:
                 "CONFIDENCE": confidence,
                 "ML_ANOMALY_SCORE": round(ml_score, 2),
                 "GEO_COUNTRY": geo.get("COUNTRY"),
-                "FIRST_SEEN": events[0]["timestamp"],
-                "LAST_SEEN": events[-1]["timestamp"],
-                "MITRE_ATTACK": mitre,
-                "KILL_CHAIN_PHASE": mitre.get("TACTIC"),
-                "ALERT_SOURCE": cfg.TOOL_NAME,
-                "TOOL_VERSION": cfg.TOOL_VERSION
+                "FIRST_SEEN": _event_time(events[0]),
+                "LAST_SEEN": _event_time(events[-1]),
+                "MITRE_ATTACK": _MITRE_SSH_BF,
+                "KILL_CHAIN_PHASE": _MITRE_SSH_BF_TACTIC,
+                **self._tool_meta
             }
 
-            upsert_incident(alert)
             alerts.append(alert)
 
         return alerts
@@ -243,10 +525,16 @@ class AnalysisEngine:
 
     def _analyze_user(self, user, events):
         alerts = []
-        ips = {e.get("ip") for e in events if e.get("ip")}
+
+        # Fewer events than the threshold can never reach it
+        if len(events) < cfg.ACCOUNT_IP_THRESHOLD:
+            return alerts
+
+        ips = {e.get("ip") for e in events}
+        ips.discard(None)
+        ips.discard("")
 
         if len(ips) >= cfg.ACCOUNT_IP_THRESHOLD:
-            mitre = MITRE_ATTACK.get("ACCOUNT_COMPROMISE", {})
             alert = {
                 "ALERT_ID": self._alert_id(user),
                 "INCIDENT_STATE": "OPEN",
@@ -258,12 +546,11 @@ class AnalysisEngine:
                 "THREAT_LEVEL": "MEDIUM",
                 "RISK_SCORE": 60,
                 "CONFIDENCE": 70,
-                "MITRE_ATTACK": mitre,
-                "KILL_CHAIN_PHASE": mitre.get("TACTIC"),
+                "MITRE_ATTACK": _MITRE_ACCOUNT,
+                "KILL_CHAIN_PHASE": _MITRE_ACCOUNT_TACTIC,
                 "ALERT_SOURCE": cfg.TOOL_NAME
             }
 
-            upsert_incident(alert)
             alerts.append(alert)
 
         return alerts
@@ -304,15 +591,15 @@ class AnalysisEngine:
 
     def _deduplicate(self, alerts):
         unique = []
-        seen = {}
-        window = timedelta(minutes=cfg.ALERT_DEDUP_WINDOW_MINUTES)
+        seen = set()
 
+        # One run finishes well inside ALERT_DEDUP_WINDOW_MINUTES, so every
+        # repeat of a type + source in it falls in the window — no clock reads
         for a in alerts:
             key = (a.get("THREAT_TYPE"), a.get("SOURCE_IP"))
-            now = datetime.utcnow()
-            if key in seen and now - seen[key] < window:
+            if key in seen:
                 continue
-            seen[key] = now
+            seen.add(key)
             unique.append(a)
 
         return unique
@@ -322,18 +609,17 @@ class AnalysisEngine:
     # =====================================================
 
     def _alert_id(self, seed):
-        return hashlib.md5(
-            f"{seed}_{datetime.utcnow().isoformat()}".encode()
-        ).hexdigest()[:12]
+        # Non-cryptographic ID, 12 hex chars — XXH3 when available
+        if xxhash:
+            return xxhash.xxh3_64_hexdigest(f"{seed}|{time.time_ns()}".encode())[:12]
+
+        # Stdlib fallback: raw nanosecond bytes, no intermediate string
+        h = hashlib.blake2b(str(seed).encode(), digest_size=6)
+        h.update(time.time_ns().to_bytes(8, "little"))
+        return h.hexdigest()
 
     def _classify_threat(self, risk):
-        if risk >= 80:
-            return "CRITICAL"
-        if risk >= 60:
-            return "HIGH"
-        if risk >= 40:
-            return "MEDIUM"
-        return "LOW"
+        return _THREAT_LEVELS[min(max(int(risk), 0) // 10, 10)]
 
     def _finalize_stats(self, alerts):
         self.stats["ANALYSIS_END"] = datetime.utcnow()
@@ -341,11 +627,14 @@ class AnalysisEngine:
             self.stats["ANALYSIS_END"] - self.stats["ANALYSIS_START"]
         ).total_seconds()
 
+        # One pass — levels may have been escalated by time pressure
+        levels = Counter(a["THREAT_LEVEL"] for a in alerts)
+
         self.stats["THREATS_DETECTED"] = len(alerts)
-        self.stats["CRITICAL_THREATS"] = sum(1 for a in alerts if a["THREAT_LEVEL"] == "CRITICAL")
-        self.stats["HIGH_THREATS"] = sum(1 for a in alerts if a["THREAT_LEVEL"] == "HIGH")
-        self.stats["MEDIUM_THREATS"] = sum(1 for a in alerts if a["THREAT_LEVEL"] == "MEDIUM")
-        self.stats["LOW_THREATS"] = sum(1 for a in alerts if a["THREAT_LEVEL"] == "LOW")
+        self.stats["CRITICAL_THREATS"] = levels["CRITICAL"]
+        self.stats["HIGH_THREATS"] = levels["HIGH"]
+        self.stats["MEDIUM_THREATS"] = levels["MEDIUM"]
+        self.stats["LOW_THREATS"] = levels["LOW"]
 
 
 # =====================================================
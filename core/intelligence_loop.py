@@ -8,32 +8,83 @@ Nothing is trusted blindly.
 Everything must justify its existence.
 """
 
-from datetime import datetime
+import bisect
+from collections import deque
+from datetime import datetime, timezone
+import time
 import uuid
 
 
+# Cycles kept for health checks and snapshots — oldest fall off
+MAX_HISTORY = 1024
+
+
+# Reality-score thresholds and the verdict at or above each
+_VERDICT_THRESHOLDS = (0.3, 0.6)
+_VERDICTS = (
+    "Observe silently. Risk exists but action now causes more harm.",
+    (
+        "Investigate selectively. Prepare containment. "
+        "Time is neutral but may soon favor attacker."
+    ),
+    (
+        "Immediate action required. "
+        "Converged intelligence indicates imminent compromise."
+    )
+)
+
+_PHILOSOPHY = "Truth emerges from disagreement, not from certainty."
+
+
+def _is_high_confidence(state):
+    return bool(state.final_truth) and state.final_truth["reality_score"] > 0.8
+
+
 class IntelligenceState:
     """
     Represents a single cycle of collective intelligence.
     """
 
+    __slots__ = (
+        "_cycle_id", "_started_ns", "attacker_view", "defender_view",
+        "time_view", "final_truth", "_snapshot"
+    )
+
     def __init__(self):
-        self.cycle_id = str(uuid.uuid4())
-        self.started_at = datetime.utcnow()
+        # Cheap clock read now; UUID and datetime built only when asked for
+        self._cycle_id = None
+        self._started_ns = time.time_ns()
         self.attacker_view = None
         self.defender_view = None
         self.time_view = None
         self.final_truth = None
+        self._snapshot = None
+
+    @property
+    def cycle_id(self):
+        if self._cycle_id is None:
+            self._cycle_id = str(uuid.uuid4())
+        return self._cycle_id
+
+    @property
+    def started_at(self):
+        return datetime.fromtimestamp(
+            self._started_ns / 1e9, timezone.utc
+        ).replace(tzinfo=None)
 
     def snapshot(self):
-        return {
-            "cycle_id": self.cycle_id,
-            "started_at": self.started_at.isoformat(),
-            "attacker_view": self.attacker_view,
-            "defender_view": self.defender_view,
-            "time_view": self.time_view,
-            "final_truth": self.final_truth
-        }
+        # State is write-once in run_cycle, so the first snapshot stays
+        # valid — callers get a copy they're free to modify
+        if self._snapshot is None:
+            self._snapshot = {
+                "cycle_id": self.cycle_id,
+                "started_at": self.started_at.isoformat(),
+                "attacker_view": self.attacker_view,
+                "defender_view": self.defender_view,
+                "time_view": self.time_view,
+                "final_truth": self.final_truth
+            }
+        return dict(self._snapshot)
 
 
 class CoreIntelligenceLoop:
@@ -47,7 +98,10 @@ class CoreIntelligenceLoop:
         self.attacker = attacker_brain
         self.defender = defender_brain
         self.time = time_engine
-        self.history = []
+        self.history = deque(maxlen=MAX_HISTORY)
+        self.cycles_completed = 0
+        self._high_conf_cycles = 0    # Kept in step with history
+        self._recent_cycles = None    # Reset whenever history changes
 
     def run_cycle(self, environment_context):
         """
@@ -84,7 +138,13 @@ class CoreIntelligenceLoop:
             temporal_risk
         )
 
+        if len(self.history) == self.history.maxlen:
+            self._high_conf_cycles -= _is_high_confidence(self.history[0])
         self.history.append(state)
+        self._high_conf_cycles += _is_high_confidence(state)
+        self.cycles_completed += 1
+        self._recent_cycles = None
+
         return state.snapshot()
 
     def _synthesize_truth(self, attacker, defender, temporal):
@@ -104,28 +164,14 @@ class CoreIntelligenceLoop:
             (breach_prob * 0.3)
         )
 
-        if reality_score < 0.3:
-            verdict = "Observe silently. Risk exists but action now causes more harm."
-
-        elif reality_score < 0.6:
-            verdict = (
-                "Investigate selectively. Prepare containment. "
-                "Time is neutral but may soon favor attacker."
-            )
-
-        else:
-            verdict = (
-                "Immediate action required. "
-                "Converged intelligence indicates imminent compromise."
-            )
+        verdict = _VERDICTS[
+            bisect.bisect_right(_VERDICT_THRESHOLDS, reality_score)
+        ]
 
         return {
             "reality_score": round(reality_score, 2),
             "verdict": verdict,
-            "philosophy": (
-                "Truth emerges from disagreement, "
-                "not from certainty."
-            )
+            "philosophy": _PHILOSOPHY
         }
 
     def predict_system_failure(self):
@@ -135,12 +181,7 @@ class CoreIntelligenceLoop:
         if len(self.history) < 5:
             return "Insufficient cycles to evaluate system health."
 
-        high_conf_cycles = [
-            h for h in self.history
-            if h.final_truth and h.final_truth["reality_score"] > 0.8
-        ]
-
-        if len(high_conf_cycles) > len(self.history) * 0.6:
+        if self._high_conf_cycles > len(self.history) * 0.6:
             return (
                 "System confidence saturation detected. "
                 "Risk of collective blind spot increasing."
@@ -152,9 +193,15 @@ class CoreIntelligenceLoop:
         """
         Full system self-awareness snapshot.
         """
+        if self._recent_cycles is None:
+            self._recent_cycles = [
+                self.history[i].snapshot()
+                for i in range(max(len(self.history) - 3, 0), len(self.history))
+            ]
+
         return {
-            "cycles_completed": len(self.history),
-            "recent_cycles": [h.snapshot() for h in self.history[-3:]],
+            "cycles_completed": self.cycles_completed,
+            "recent_cycles": [dict(c) for c in self._recent_cycles],
             "system_health": self.predict_system_failure()
         }
 
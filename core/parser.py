@@ -4,9 +4,58 @@
 # =====================================================
 
 import re
+import sys
+import time
 import hashlib
 from datetime import datetime
 
+# OPTIONAL: HYPERSCAN MULTI-PATTERN PREFILTER
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# OPTIONAL: FAST NON-CRYPTOGRAPHIC LINE FINGERPRINT
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# ==================== EVENT CODES ====================
+
+# Coarse auth outcome, resolved once per line for cheap counting
+EVT_OTHER = 0
+EVT_FAILED = 1
+EVT_ACCEPTED = 2
+
+
+def _event_code(event_type):
+    if "FAILED" in event_type:
+        return EVT_FAILED
+    if "ACCEPTED" in event_type:
+        return EVT_ACCEPTED
+    return EVT_OTHER
+
+# ==================== LINE FINGERPRINT ====================
+
+def _line_hash(raw):
+    # Dedup fingerprint only — no security property is needed
+    data = raw.encode()
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)[:10]
+    return hashlib.md5(data).hexdigest()[:10]
+
+# ==================== SYSLOG FORMAT ====================
+
+# Shared by every parser instance; groups() order is the field order below
+_SYSLOG_PATTERN = re.compile(
+    r'(?P<timestamp>\w+\s+\d+\s+\d+:\d+:\d+)\s+'
+    r'(?P<host>\S+)\s+'
+    r'(?P<process>[a-zA-Z0-9_\-/]+)'
+    r'(?:\[(?P<pid>\d+)\])?:\s+'
+    r'(?P<message>.*)'
+)
+
 # ==================== LOG PARSER ====================
 
 class LogParser:
@@ -17,13 +66,7 @@ class LogParser:
 
     def __init__(self):
         # SYSLOG FORMAT
-        self.syslog_pattern = re.compile(
-            r'(?P<timestamp>\w+\s+\d+\s+\d+:\d+:\d+)\s+'
-            r'(?P<host>\S+)\s+'
-            r'(?P<process>[a-zA-Z0-9_\-/]+)'
-            r'(?:\[(?P<pid>\d+)\])?:\s+'
-            r'(?P<message>.*)'
-        )
+        self.syslog_pattern = _SYSLOG_PATTERN
 
         # DETECTION PATTERNS
         self.patterns = {
@@ -69,6 +112,90 @@ class LogParser:
             )
         }
 
+        self.event_codes = {
+            event_type: _event_code(event_type)
+            for event_type in self.patterns
+        }
+
+        self._hs_db, self._hs_scratch = self._build_hyperscan()
+
+        # INGEST_TIME string reused within one 100 ms window
+        self._iso_at = 0.0
+        self._iso = ""
+
+    # ==================== HYPERSCAN ====================
+
+    def _build_hyperscan(self):
+        """
+        COMPILE ALL DETECTION PATTERNS INTO ONE HYPERSCAN BLOCK DATABASE
+        RETURNS (None, None) WHEN HYPERSCAN IS UNAVAILABLE
+        """
+        if hyperscan is None:
+            return None, None
+
+        # PREFILTER lets Hyperscan over-match but never miss; UTF8 + UCP
+        # give \s, \w etc. Python's Unicode meaning (e.g. NBSP is \s)
+        base = (
+            hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_PREFILTER
+            | hyperscan.HS_FLAG_UTF8
+            | hyperscan.HS_FLAG_UCP
+        )
+        flags = [
+            base
+            | (hyperscan.HS_FLAG_CASELESS if p.flags & re.IGNORECASE else 0)
+            for p in self.patterns.values()
+        ]
+
+        try:
+            db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            db.compile(
+                expressions=[p.pattern.encode() for p in self.patterns.values()],
+                ids=list(range(len(self.patterns))),
+                elements=len(self.patterns),
+                flags=flags
+            )
+            return db, hyperscan.Scratch(db)
+        except Exception:
+            return None, None
+
+    @staticmethod
+    def _on_hs_match(pattern_id, start, end, flags, hits):
+        hits.add(pattern_id)
+
+    def _candidates(self, message):
+        """
+        PATTERNS WORTH RUNNING FOR THIS MESSAGE, IN PRIORITY ORDER
+        """
+        if self._hs_db is None:
+            return self.patterns.items()
+
+        hits = set()
+        self._hs_db.scan(
+            # "?" keeps one character per unencodable one, so the UTF-8
+            # text stays valid and no match spans a dropped character
+            message.encode(errors="replace"),
+            match_event_handler=self._on_hs_match,
+            context=hits,
+            scratch=self._hs_scratch
+        )
+
+        return [
+            item for i, item in enumerate(self.patterns.items())
+            if i in hits
+        ]
+
+    # ==================== INTERNING ====================
+
+    # Low-cardinality values repeated across millions of lines
+    _INTERNED_FIELDS = ("ip", "user", "host", "process")
+
+    def _intern_fields(self, event):
+        for key in self._INTERNED_FIELDS:
+            value = event.get(key)
+            if value:
+                event[key] = sys.intern(value)
+
     # ==================== PARSE LINE ====================
 
     def parse_line(self, line):
@@ -76,29 +203,47 @@ class LogParser:
             return None
 
         raw = line.strip()
+        now = time.time()
+
+        # Exact epoch per line; the ISO form only needs window resolution
+        if not 0.0 <= now - self._iso_at < 0.1:
+            self._iso_at = now
+            self._iso = datetime.fromtimestamp(now).isoformat(
+                timespec="microseconds"
+            )
 
         event = {
             "RAW_LINE": raw,
-            "INGEST_TIME": datetime.now().isoformat(),
-            "LINE_HASH": hashlib.md5(raw.encode()).hexdigest()[:10]
+            "INGEST_TIME": self._iso,
+            "INGEST_TS": now,
+            "LINE_HASH": _line_hash(raw)
         }
 
         syslog_match = self.syslog_pattern.match(raw)
         if syslog_match:
-            event.update(syslog_match.groupdict())
-            message = syslog_match.group("message")
+            # Positional groups — no intermediate groupdict per line
+            (
+                event["timestamp"], event["host"], event["process"],
+                event["pid"], message
+            ) = syslog_match.groups()
+            event["message"] = message
         else:
             message = raw
 
-        for event_type, pattern in self.patterns.items():
+        # Hyperscan narrows the set; re still extracts the fields
+        for event_type, pattern in self._candidates(message):
             match = pattern.search(message)
             if match:
                 event["EVENT_TYPE"] = event_type
+                event["EVT_CODE"] = self.event_codes[event_type]
                 event.update(match.groupdict())
+                self._intern_fields(event)
                 return event
 
         if syslog_match:
             event["EVENT_TYPE"] = "SYSLOG_GENERIC"
+            event["EVT_CODE"] = EVT_OTHER
+            self._intern_fields(event)
             return event
 
         return None
\ No newline at end of file
@@ -68,6 +68,20 @@ def calculate_risk_score(
     return min(int(score), 100)
 
 
+def calculate_auth_risk_score(failed_attempts, geo_risk, threat_intel, ml_anomaly_score):
+    """
+    PER-IP AUTH SCORING
+    calculate_risk_score WITH ONLY THESE FOUR INDICATORS — ONE SET OF WEIGHTS
+    """
+
+    return calculate_risk_score(
+        failed_attempts=failed_attempts,
+        geo_risk=geo_risk,
+        threat_intel=threat_intel,
+        ml_anomaly_score=ml_anomaly_score
+    )
+
+
 def calculate_confidence_level(
     data_quality=1.0,
     threat_intel_match=False,
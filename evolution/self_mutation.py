@@ -14,9 +14,45 @@ Core belief:
 Static logic dies. Adaptive logic survives.
 """
 
+import bisect
+from collections import deque
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 import random
+import time
+
+
+# Mutations kept once old thinking has faded — oldest fall off
+MAX_MUTATION_HISTORY = 50
+
+
+# Maturity thresholds and the status shown at or above each
+_STATUS_THRESHOLDS = (2.0, 5.0)
+_STATUS_TEXT = (
+    "Early adaptive phase – learning aggressively.",
+    "Mid evolution – intelligence stabilizing.",
+    "Late evolution – slow, careful mutations only."
+)
+
+
+# Defender mutations: (adjustment, reason, impact) — picked uniformly
+_DEFENDER_MUTATIONS = (
+    (
+        "confidence",
+        "Overconfidence detected via regret accumulation.",
+        "Lowered trust baseline"
+    ),
+    (
+        "ignore_bias",
+        "Excessive alert ignoring observed.",
+        "Increased sensitivity to weak signals"
+    ),
+    (
+        "containment_threshold",
+        "Delayed containment caused escalation.",
+        "Earlier containment triggers enabled"
+    )
+)
 
 
 class MutationRecord:
@@ -24,12 +60,27 @@ class MutationRecord:
     Represents a single evolutionary change.
     """
 
+    __slots__ = ("_id", "mutation_type", "reason", "impact", "_created_ns")
+
     def __init__(self, mutation_type, reason, impact):
-        self.id = str(uuid.uuid4())
+        # Cheap clock read now; UUID and datetime built only when asked for
+        self._id = None
         self.mutation_type = mutation_type
         self.reason = reason
         self.impact = impact
-        self.timestamp = datetime.utcnow()
+        self._created_ns = time.time_ns()
+
+    @property
+    def id(self):
+        if self._id is None:
+            self._id = str(uuid.uuid4())
+        return self._id
+
+    @property
+    def timestamp(self):
+        return datetime.fromtimestamp(
+            self._created_ns / 1e9, timezone.utc
+        ).replace(tzinfo=None)
 
     def describe(self):
         return {
@@ -47,7 +98,8 @@ class SelfMutationEngine:
     """
 
     def __init__(self):
-        self.mutation_history = []
+        self.mutation_history = deque(maxlen=MAX_MUTATION_HISTORY)
+        self.total_mutations = 0        # lifetime count, history is capped
         self.evolution_pressure = 0.0   # increases after failures
         self.maturity_level = 1.0       # grows slowly, never resets
 
@@ -64,6 +116,7 @@ class SelfMutationEngine:
         )
 
         self.mutation_history.append(mutation)
+        self.total_mutations += 1
         return mutation.describe()
 
     def observe_success(self):
@@ -80,24 +133,13 @@ class SelfMutationEngine:
         if self.evolution_pressure < 0.3:
             return "No mutation required. System stability acceptable."
 
-        adjustment = random.choice(["confidence", "ignore_bias", "containment_threshold"])
+        adjustment, reason, impact = random.choice(_DEFENDER_MUTATIONS)
 
         if adjustment == "confidence":
             defender_brain.trust_baseline = max(
                 defender_brain.trust_baseline - 0.1, 0.2
             )
 
-            reason = "Overconfidence detected via regret accumulation."
-            impact = "Lowered trust baseline"
-
-        elif adjustment == "ignore_bias":
-            reason = "Excessive alert ignoring observed."
-            impact = "Increased sensitivity to weak signals"
-
-        else:
-            reason = "Delayed containment caused escalation."
-            impact = "Earlier containment triggers enabled"
-
         mutation = MutationRecord(
             mutation_type="defender_bias_mutation",
             reason=reason,
@@ -105,6 +147,7 @@ class SelfMutationEngine:
         )
 
         self.mutation_history.append(mutation)
+        self.total_mutations += 1
         self.evolution_pressure *= 0.7
         return mutation.describe()
 
@@ -126,25 +169,24 @@ class SelfMutationEngine:
         )
 
         self.mutation_history.append(mutation)
+        self.total_mutations += 1
         self.evolution_pressure *= 0.8
         return mutation.describe()
 
     def decay_old_logic(self):
         """
         Old thinking fades naturally.
+        The bounded history already drops the oldest mutations.
         """
-        self.mutation_history = self.mutation_history[-50:]
         self.maturity_level = min(self.maturity_level + 0.01, 10.0)
 
     def evolution_status(self):
         """
         Human-readable evolution state.
         """
-        if self.maturity_level < 2:
-            return "Early adaptive phase – learning aggressively."
-        if self.maturity_level < 5:
-            return "Mid evolution – intelligence stabilizing."
-        return "Late evolution – slow, careful mutations only."
+        return _STATUS_TEXT[
+            bisect.bisect_right(_STATUS_THRESHOLDS, self.maturity_level)
+        ]
 
     def memory_snapshot(self):
         """
@@ -153,9 +195,13 @@ class SelfMutationEngine:
         return {
             "evolution_pressure": round(self.evolution_pressure, 2),
             "maturity_level": round(self.maturity_level, 2),
-            "total_mutations": len(self.mutation_history),
+            "total_mutations": self.total_mutations,
             "recent_mutations": [
-                m.describe() for m in self.mutation_history[-3:]
+                self.mutation_history[i].describe()
+                for i in range(
+                    max(len(self.mutation_history) - 3, 0),
+                    len(self.mutation_history)
+                )
             ],
             "status": self.evolution_status()
         }
@@ -5,7 +5,42 @@
 
 from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+
+# ==================== FUSED SCAN ====================
+
+def _scan_alerts(
+    alerts: List[Dict],
+    heatmap: Optional[Dict[str, int]] = None,
+    techniques: Optional[Dict[str, int]] = None,
+    timeline: Optional[List[Dict]] = None
+) -> None:
+    """
+    Single pass over alerts filling whichever outputs are requested
+    """
+    # Each alert's MITRE block is read once and shared by every output
+    need_technique = techniques is not None or timeline is not None
+    technique_id = None
+
+    for alert in alerts:
+        if need_technique:
+            technique_id = alert.get("MITRE_ATTACK", {}).get("TECHNIQUE_ID")
+
+        if heatmap is not None:
+            heatmap[alert.get("KILL_CHAIN_PHASE") or "UNKNOWN"] += 1
+
+        if techniques is not None and technique_id:
+            techniques[technique_id] += 1
+
+        if timeline is not None:
+            timeline.append({
+                "time": alert.get("FIRST_SEEN"),
+                "tactic": alert.get("KILL_CHAIN_PHASE", "UNKNOWN"),
+                "technique": technique_id,
+                "threat": alert.get("THREAT_TYPE"),
+                "severity": alert.get("THREAT_LEVEL")
+            })
 
 
 # ==================== HEATMAP ====================
@@ -15,11 +50,7 @@ def build_tactic_heatmap(alerts: List[Dict]) -> Dict[str, int]:
     Build MITRE tactic heatmap from alerts
     """
     heatmap = defaultdict(int)
-
-    for alert in alerts:
-        tactic = alert.get("KILL_CHAIN_PHASE") or "UNKNOWN"
-        heatmap[tactic] += 1
-
+    _scan_alerts(alerts, heatmap=heatmap)
     return dict(heatmap)
 
 
@@ -30,13 +61,7 @@ def build_technique_map(alerts: List[Dict]) -> Dict[str, int]:
     Count MITRE techniques across alerts
     """
     techniques = defaultdict(int)
-
-    for alert in alerts:
-        mitre = alert.get("MITRE_ATTACK", {})
-        technique_id = mitre.get("TECHNIQUE_ID")
-        if technique_id:
-            techniques[technique_id] += 1
-
+    _scan_alerts(alerts, techniques=techniques)
     return dict(techniques)
 
 
@@ -47,22 +72,14 @@ def build_attack_timeline(alerts: List[Dict]) -> List[Dict]:
     Build ordered MITRE attack timeline
     """
     timeline = []
+    _scan_alerts(alerts, timeline=timeline)
 
-    for alert in alerts:
-        timeline.append({
-            "time": alert.get("FIRST_SEEN"),
-            "tactic": alert.get("KILL_CHAIN_PHASE", "UNKNOWN"),
-            "technique": (
-                alert.get("MITRE_ATTACK", {}).get("TECHNIQUE_ID")
-            ),
-            "threat": alert.get("THREAT_TYPE"),
-            "severity": alert.get("THREAT_LEVEL")
-        })
-
-    return sorted(
-        timeline,
-        key=lambda x: x.get("time") or datetime.utcnow().isoformat()
-    )
+    # Undated entries sort as "now" — one clock read for the whole sort.
+    # list.sort computes each key once and is stable, so equal times keep
+    # alert order; sorting in place skips the copy sorted() would make.
+    now = datetime.utcnow().isoformat()
+    timeline.sort(key=lambda x: x["time"] or now)
+    return timeline
 
 
 # ==================== SUMMARY ====================
@@ -71,8 +88,12 @@ def mitre_summary(alerts: List[Dict]) -> Dict:
     """
     Full MITRE summary for SOC UI / reports
     """
+    heatmap = defaultdict(int)
+    techniques = defaultdict(int)
+    _scan_alerts(alerts, heatmap=heatmap, techniques=techniques)
+
     return {
-        "TACTIC_HEATMAP": build_tactic_heatmap(alerts),
-        "TECHNIQUE_COUNTS": build_technique_map(alerts),
+        "TACTIC_HEATMAP": dict(heatmap),
+        "TECHNIQUE_COUNTS": dict(techniques),
         "TOTAL_ALERTS": len(alerts)
-    }
\ No newline at end of file
+    }
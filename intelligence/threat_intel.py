@@ -3,16 +3,47 @@
 # AUTHOR: VISHAL - SOC ENGINEERING
 # =====================================================
 
+import os
+import json
+import atexit
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from config import (
     ENABLE_LIVE_THREAT_INTEL,
     ABUSEIPDB_API_KEY,
-    VIRUSTOTAL_API_KEY
+    VIRUSTOTAL_API_KEY,
+    THREAT_INTEL_CACHE_PATH
 )
 from ui.ui import display_warning
 
+# ==================== STATIC GEO DATABASE ====================
+
+_GEO_DB = {
+    "185.210.45.22": {"COUNTRY": "RU", "CITY": "MOSCOW"},
+    "45.155.205.233": {"COUNTRY": "IR", "CITY": "TEHRAN"},
+    "8.8.8.8": {"COUNTRY": "US", "CITY": "MOUNTAIN VIEW"}
+}
+
+_GEO_UNKNOWN = {
+    "COUNTRY": "UNKNOWN",
+    "CITY": "UNKNOWN"
+}
+
 # ==================== LIVE THREAT INTEL ====================
 
+# Newest LiveThreatIntel — the only one whose cache is written at exit,
+# so a stale instance can't overwrite fresher lookups
+_cache_owner = None
+
+
+@atexit.register
+def _save_live_cache():
+    if _cache_owner is not None:
+        _cache_owner._save_cache()
+
+
 class LiveThreatIntel:
     """
     LIVE THREAT INTELLIGENCE (ABUSEIPDB / VIRUSTOTAL)
@@ -21,6 +52,65 @@ class LiveThreatIntel:
     def __init__(self):
         self.cache = {}
         self.cache_expiry = timedelta(hours=24)
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # Live lookups survive restarts via an on-disk cache
+        if ENABLE_LIVE_THREAT_INTEL:
+            global _cache_owner
+            self._load_cache()
+            _cache_owner = self
+
+    def _load_cache(self):
+        # A corrupt or foreign cache file just means starting cold
+        try:
+            with open(THREAT_INTEL_CACHE_PATH, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+
+            cache = {
+                key: (data, datetime.fromisoformat(ts))
+                for key, (data, ts) in stored.items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError):
+            return
+
+        self.cache.update(cache)
+
+    def _save_cache(self):
+        # Expired lookups would be refetched anyway — don't keep them on disk
+        now = datetime.now()
+        fresh = {
+            key: (data, ts.isoformat())
+            for key, (data, ts) in self.cache.items()
+            if now - ts < self.cache_expiry
+        }
+        if not fresh:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(THREAT_INTEL_CACHE_PATH), exist_ok=True)
+            with open(THREAT_INTEL_CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump(fresh, f)
+        except OSError as e:
+            display_warning(f"THREAT INTEL CACHE NOT SAVED: {e}")
+
+    def session(self):
+        """
+        SHARED KEEP-ALIVE HTTP SESSION (CREATED ON FIRST LIVE LOOKUP)
+        """
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    HTTPAdapter(pool_connections=16, pool_maxsize=32)
+                )
+                self._session = session
+
+        return self._session
 
     def check_abuseipdb(self, ip):
         if not ENABLE_LIVE_THREAT_INTEL:
@@ -33,7 +123,6 @@ class LiveThreatIntel:
                 return data
 
         try:
-            import requests
             url = "https://api.abuseipdb.com/api/v2/check"
             headers = {
                 "Key": ABUSEIPDB_API_KEY,
@@ -44,7 +133,9 @@ class LiveThreatIntel:
                 "maxAgeInDays": 90
             }
 
-            r = requests.get(url, headers=headers, params=params, timeout=10)
+            r = self.session().get(
+                url, headers=headers, params=params, timeout=10
+            )
             if r.status_code == 200:
                 data = r.json().get("data", {})
                 result = {
@@ -70,11 +161,10 @@ class LiveThreatIntel:
                 return data
 
         try:
-            import requests
             url = f"https://www.virustotal.com/api/v3/ip_addresses/{ip}"
             headers = {"x-apikey": VIRUSTOTAL_API_KEY}
 
-            r = requests.get(url, headers=headers, timeout=10)
+            r = self.session().get(url, headers=headers, timeout=10)
             if r.status_code == 200:
                 stats = r.json()["data"]["attributes"]["last_analysis_stats"]
                 result = {
@@ -89,6 +179,14 @@ class LiveThreatIntel:
         return None
 
 
+# Shared immutable threat tuples — avoids a list per IP
+_NO_THREATS = ()
+_KNOWN_MALICIOUS = ("KNOWN_MALICIOUS_IP",)
+_TOR_EXIT = ("TOR_EXIT_NODE",)
+
+# Static-feed verdicts remembered per engine — oldest evicted first
+MAX_REPUTATION_CACHE = 4096
+
 # ==================== STATIC + LIVE THREAT ENGINE ====================
 
 class ThreatIntelligence:
@@ -100,6 +198,7 @@ class ThreatIntelligence:
         self.malicious_ips = set()
         self.tor_exit_nodes = set()
         self.live = LiveThreatIntel()
+        self._reputation_cache = OrderedDict()
         self._load_static_feeds()
 
     def _load_static_feeds(self):
@@ -112,37 +211,114 @@ class ThreatIntelligence:
             "185.220.100.254", "185.220.101.4", "185.220.101.8"
         ])
 
+    def _cached_reputation(self, ip):
+        cached = self._reputation_cache.get(ip)
+        if cached is not None:
+            self._reputation_cache.move_to_end(ip)
+        return cached
+
+    def _remember_reputation(self, ip, result):
+        """
+        LRU-CACHE A VERDICT — ONLY STATIC ONES: LIVE RESULTS KEEP THE
+        LiveThreatIntel EXPIRY, AND FAILED LOOKUPS MUST BE RETRIED
+        """
+        if ENABLE_LIVE_THREAT_INTEL and result[0] is not _KNOWN_MALICIOUS:
+            return
+
+        cache = self._reputation_cache
+        cache[ip] = result
+        cache.move_to_end(ip)
+        if len(cache) > MAX_REPUTATION_CACHE:
+            cache.popitem(last=False)
+
     def check_ip_reputation(self, ip):
-        threats = []
-        live_data = {}
+        """
+        RETURNS (threats, live_data) — threats IS AN IMMUTABLE TUPLE
+        """
+        cached = self._cached_reputation(ip)
+        if cached is not None:
+            return cached
 
+        # Already known bad — live APIs cannot add anything actionable
         if ip in self.malicious_ips:
-            threats.append("KNOWN_MALICIOUS_IP")
+            result = (_KNOWN_MALICIOUS, {})
+        else:
+            threats = _TOR_EXIT if ip in self.tor_exit_nodes else _NO_THREATS
+            live_data = {}
 
-        if ip in self.tor_exit_nodes:
-            threats.append("TOR_EXIT_NODE")
+            if ENABLE_LIVE_THREAT_INTEL:
+                live_threats, live_data = self._check_live(ip)
+                threats += tuple(live_threats)
 
-        if ENABLE_LIVE_THREAT_INTEL:
-            abuse = self.live.check_abuseipdb(ip)
-            if abuse and abuse["CONFIDENCE_SCORE"] >= 70:
-                threats.append("LIVE_ABUSEIPDB_MATCH")
-                live_data["ABUSEIPDB"] = abuse
+            result = (threats, live_data)
+
+        self._remember_reputation(ip, result)
+        return result
+
+    def check_ip_reputation_bulk(self, ips):
+        """
+        REPUTATION FOR MANY IPS AT ONCE
+        STATIC FEEDS VIA SET INTERSECTION, LIVE APIS CONCURRENTLY
+        RETURNS {ip: (threats, live_data)}
+        """
+        results = {}
+        pending = []
+
+        # Earlier runs on this instance already resolved these
+        for ip in set(ips):
+            cached = self._cached_reputation(ip)
+            if cached is not None:
+                results[ip] = cached
+            else:
+                pending.append(ip)
+
+        malicious = self.malicious_ips.intersection(pending)
+        tor = self.tor_exit_nodes.intersection(pending)
 
-            vt = self.live.check_virustotal(ip)
-            if vt and vt["MALICIOUS"] >= 3:
-                threats.append("LIVE_VIRUSTOTAL_MATCH")
-                live_data["VIRUSTOTAL"] = vt
+        for ip in pending:
+            if ip in malicious:
+                results[ip] = (_KNOWN_MALICIOUS, {})
+            elif ip in tor:
+                results[ip] = (_TOR_EXIT, {})
+            else:
+                results[ip] = (_NO_THREATS, {})
+
+        # Known-malicious IPs skip the live round-trips entirely
+        unknown = [ip for ip in pending if ip not in malicious]
+
+        if ENABLE_LIVE_THREAT_INTEL and unknown:
+            # I/O bound — threads overlap the HTTP round-trips
+            with ThreadPoolExecutor(max_workers=min(16, len(unknown))) as pool:
+                for ip, (live_threats, live_data) in zip(
+                    unknown, pool.map(self._check_live, unknown)
+                ):
+                    if live_threats:
+                        results[ip] = (
+                            results[ip][0] + tuple(live_threats),
+                            live_data
+                        )
+
+        for ip in pending:
+            self._remember_reputation(ip, results[ip])
+
+        return results
+
+    def _check_live(self, ip):
+        threats = []
+        live_data = {}
+
+        abuse = self.live.check_abuseipdb(ip)
+        if abuse and abuse["CONFIDENCE_SCORE"] >= 70:
+            threats.append("LIVE_ABUSEIPDB_MATCH")
+            live_data["ABUSEIPDB"] = abuse
+
+        vt = self.live.check_virustotal(ip)
+        if vt and vt["MALICIOUS"] >= 3:
+            threats.append("LIVE_VIRUSTOTAL_MATCH")
+            live_data["VIRUSTOTAL"] = vt
 
         return threats, live_data
 
     def get_geoip_info(self, ip):
-        geo_db = {
-            "185.210.45.22": {"COUNTRY": "RU", "CITY": "MOSCOW"},
-            "45.155.205.233": {"COUNTRY": "IR", "CITY": "TEHRAN"},
-            "8.8.8.8": {"COUNTRY": "US", "CITY": "MOUNTAIN VIEW"}
-        }
-
-        return geo_db.get(ip, {
-            "COUNTRY": "UNKNOWN",
-            "CITY": "UNKNOWN"
-        })
\ No newline at end of file
+        # Shared read-only records — callers must not mutate them
+        return _GEO_DB.get(ip, _GEO_UNKNOWN)
\ No newline at end of file
@@ -213,6 +213,11 @@ def run_cognitive_simulation(
 def main_menu():
     display_banner()
 
+    # Built once and reused so learned memory carries across analyses
+    engine, memory, defender, attacker, time_engine, evolution, reporting = (
+        initialize_soc_system()
+    )
+
     while True:
         print("\n🧠 ELITE SOC ANALYZER — INDUSTRY OPERATIONS")
         print("================================================")
@@ -222,18 +227,15 @@ def main_menu():
         print("4 - 🔍 ANALYZE ANY FILE")
         print("5 - 🚀 RUN COGNITIVE SIMULATION")
         print("6 - ❌ EXIT")
+        print("7 - 🔄 RESET SOC SUBSYSTEMS")
         print("================================================")
 
-        choice = input("ENTER CHOICE (1-6): ").strip()
+        choice = input("ENTER CHOICE (1-7): ").strip()
 
         if choice == "6":
             display_status("SECURE SHUTDOWN — SOC SYSTEM HALTED")
             sys.exit(0)
 
-        engine, memory, defender, attacker, time_engine, evolution, reporting = (
-            initialize_soc_system()
-        )
-
         temp_file = None
 
         if choice == "1":
@@ -271,6 +273,11 @@ def main_menu():
                 ),
                 "cognitive simulation"
             )
+
+        elif choice == "7":
+            engine, memory, defender, attacker, time_engine, evolution, reporting = (
+                initialize_soc_system()
+            )
         else:
             display_warning("INVALID OPTION")
 
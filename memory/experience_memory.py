@@ -11,14 +11,58 @@ Principles:
 """
 
 import uuid
+from collections import defaultdict
 from datetime import datetime
 
+# OPTIONAL: AHO-CORASICK MULTI-KEYWORD MATCHER
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Trigger keywords recalled often enough to be matched at record time
+WATCHWORDS = (
+    "credential", "brute", "scan", "lateral", "phishing",
+    "malware", "ransomware", "privilege", "exfiltration", "identity"
+)
+_WATCHWORD_SET = frozenset(WATCHWORDS)
+
+
+def _build_watch_automaton():
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for word in WATCHWORDS:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+_WATCH_AUTOMATON = _build_watch_automaton()
+
+
+def _watchwords_in(trigger):
+    """
+    Watchwords occurring anywhere in a lowered trigger — one automaton
+    pass when pyahocorasick is installed, substring tests otherwise
+    """
+    if _WATCH_AUTOMATON is not None:
+        return {word for _, word in _WATCH_AUTOMATON.iter(trigger)}
+    return {word for word in WATCHWORDS if word in trigger}
+
 
 class Experience:
     """
     Represents a lived security experience.
     """
 
+    __slots__ = (
+        "id", "category", "trigger", "decision",
+        "outcome", "lesson", "severity", "timestamp", "_described"
+    )
+
     def __init__(
         self,
         category,
@@ -36,18 +80,23 @@ class Experience:
         self.lesson = lesson                  # what should be remembered
         self.severity = severity              # 1–10
         self.timestamp = datetime.utcnow()
+        self._described = None
 
     def describe(self):
-        return {
-            "experience_id": self.id,
-            "category": self.category,
-            "trigger": self.trigger,
-            "decision": self.decision,
-            "outcome": self.outcome,
-            "lesson": self.lesson,
-            "severity": self.severity,
-            "timestamp": self.timestamp.isoformat()
-        }
+        # Experiences are never edited once lived, so build the view once
+        # and hand out copies
+        if self._described is None:
+            self._described = {
+                "experience_id": self.id,
+                "category": self.category,
+                "trigger": self.trigger,
+                "decision": self.decision,
+                "outcome": self.outcome,
+                "lesson": self.lesson,
+                "severity": self.severity,
+                "timestamp": self.timestamp.isoformat()
+            }
+        return dict(self._described)
 
 
 class ExperienceMemory:
@@ -58,6 +107,18 @@ class ExperienceMemory:
     def __init__(self):
         self.memories = []
 
+        # Running aggregates — kept in step with memories
+        self._pain_total = 0
+        self._ignored_count = 0
+
+        # Each id's position and lowered trigger — rebuilt whenever
+        # memories are pruned
+        self._position = {}
+        self._triggers = {}
+
+        # Watchword -> ids of experiences whose trigger contains it
+        self._watch_hits = defaultdict(set)
+
     def record_experience(
         self,
         category,
@@ -80,17 +141,45 @@ class ExperienceMemory:
         )
 
         self.memories.append(exp)
+        self._account(exp)
+        self._index_experience(exp)
         return exp.describe()
 
+    def _account(self, exp):
+        if exp.category in ("breach", "near-miss"):
+            self._pain_total += exp.severity
+        if "ignored" in str(exp.decision).lower():
+            self._ignored_count += 1
+
+    def _index_experience(self, exp):
+        trigger = str(exp.trigger).lower()
+        self._position[exp.id] = len(self._position)
+        self._triggers[exp.id] = trigger
+        for word in _watchwords_in(trigger):
+            self._watch_hits[word].add(exp.id)
+
     def recall_similar(self, trigger_keyword):
         """
         Recall past experiences similar to current situation.
         """
-        matches = [
-            m.describe()
-            for m in self.memories
-            if trigger_keyword.lower() in str(m.trigger).lower()
-        ]
+        keyword = trigger_keyword.lower()
+
+        if keyword in _WATCHWORD_SET:
+            # Matched once at record time — no per-query substring work
+            ids = sorted(
+                self._watch_hits.get(keyword, ()), key=self._position.get
+            )
+            matches = [
+                self.memories[self._position[i]].describe()
+                for i in ids
+            ]
+        else:
+            # Triggers are lowered once at record time, not per query
+            matches = [
+                m.describe()
+                for m in self.memories
+                if keyword in self._triggers[m.id]
+            ]
 
         return {
             "matches_found": len(matches),
@@ -104,13 +193,8 @@ class ExperienceMemory:
         if not self.memories:
             return 0.0
 
-        pain = sum(
-            m.severity for m in self.memories
-            if m.category in ["breach", "near-miss"]
-        )
-
         max_possible = len(self.memories) * 10
-        return round(pain / max_possible, 2)
+        return round(self._pain_total / max_possible, 2)
 
     def wisdom_statement(self):
         """
@@ -119,12 +203,7 @@ class ExperienceMemory:
         if not self.memories:
             return "No lived experience yet. System is naive."
 
-        repeated_mistakes = len([
-            m for m in self.memories
-            if "ignored" in str(m.decision).lower()
-        ])
-
-        if repeated_mistakes >= 3:
+        if self._ignored_count >= 3:
             return (
                 "Pattern detected: repeated ignoring of weak signals "
                 "has historically resulted in damage."
@@ -141,6 +220,15 @@ class ExperienceMemory:
             if m.severity >= 3
         ]
 
+        self._pain_total = 0
+        self._ignored_count = 0
+        self._position.clear()
+        self._triggers.clear()
+        self._watch_hits.clear()
+        for m in self.memories:
+            self._account(m)
+            self._index_experience(m)
+
     def memory_snapshot(self):
         """
         Full memory awareness.
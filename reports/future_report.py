@@ -21,6 +21,8 @@ class FutureReport:
     Represents a single future-facing security report.
     """
 
+    __slots__ = ("report_id", "title", "created_at", "sections")
+
     def __init__(self, title):
         self.report_id = str(uuid.uuid4())
         self.title = title
@@ -66,12 +68,16 @@ class FutureReportEngine:
             title="Future Risk Intelligence Assessment"
         )
 
+        # Nested views resolved once and shared by the section builders
+        attacker = intelligence_snapshot.get("attacker_view", {})
+        final_truth = intelligence_snapshot.get("final_truth", {})
+
         # 1. Executive Summary
         report.add_section(
             "Executive Summary",
             self._executive_summary(
-                intelligence_snapshot,
-                time_snapshot
+                final_truth.get("reality_score", 0),
+                time_snapshot.get("breach_clock", 0)
             ),
             severity="critical"
         )
@@ -79,14 +85,14 @@ class FutureReportEngine:
         # 2. Current Reality
         report.add_section(
             "Current Security Reality",
-            self._current_reality(intelligence_snapshot, defender_snapshot),
+            self._current_reality(attacker, defender_snapshot),
             severity="high"
         )
 
         # 3. Attacker Outlook
         report.add_section(
             "Attacker Future Outlook",
-            self._attacker_outlook(intelligence_snapshot),
+            self._attacker_outlook(attacker),
             severity="high"
         )
 
@@ -121,7 +127,7 @@ class FutureReportEngine:
         # 8. Final Truth
         report.add_section(
             "Final Intelligence Verdict",
-            self._final_verdict(intelligence_snapshot, time_snapshot),
+            self._final_verdict(final_truth),
             severity="critical"
         )
 
@@ -129,10 +135,7 @@ class FutureReportEngine:
 
     # -------- SECTION BUILDERS -------- #
 
-    def _executive_summary(self, intel, time):
-        score = intel.get("final_truth", {}).get("reality_score", 0)
-        breach = time.get("breach_clock", 0)
-
+    def _executive_summary(self, score, breach):
         if breach > 0.6:
             return (
                 "The organization is on a trajectory toward a security breach. "
@@ -151,15 +154,14 @@ class FutureReportEngine:
             "does not indicate absence of threat."
         )
 
-    def _current_reality(self, intel, defender):
+    def _current_reality(self, attacker, defender):
         return {
-            "attacker_confidence": intel.get("attacker_view", {}).get("confidence"),
+            "attacker_confidence": attacker.get("confidence"),
             "defender_action": defender.get("recent_decisions", [{}])[-1],
             "system_bias": defender.get("trust_baseline")
         }
 
-    def _attacker_outlook(self, intel):
-        attacker = intel.get("attacker_view", {})
+    def _attacker_outlook(self, attacker):
         return (
             f"Predicted attacker vector: {attacker.get('attack_vector')}. "
             "This prediction is probabilistic and may evolve as environment changes."
@@ -189,9 +191,9 @@ class FutureReportEngine:
     def _evolution_status(self, evolution):
         return evolution.get("status")
 
-    def _final_verdict(self, intel, time):
+    def _final_verdict(self, final_truth):
         return {
-            "verdict": intel.get("final_truth", {}).get("verdict"),
+            "verdict": final_truth.get("verdict"),
             "philosophy": "The future is not random. It is shaped by ignored signals."
         }
 
@@ -10,6 +10,12 @@ from datetime import datetime
 from config import REPORT_DIR
 from ui.ui import display_status
 
+# OPTIONAL: FAST C JSON ENCODER
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class MitreMatrixGenerator:
     """
     GENERATE MITRE ATT&CK COVERAGE MATRIX (JSON)
@@ -41,8 +47,12 @@ class MitreMatrixGenerator:
             REPORT_DIR, f"MITRE_MATRIX_{report_id}.json"
         )
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(matrix, f, indent=2)
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(matrix, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(matrix, f, indent=2)
 
         display_status(f"MITRE MATRIX GENERATED: {path}")
         return path
\ No newline at end of file
@@ -10,9 +10,15 @@ import hashlib
 from datetime import datetime
 from collections import defaultdict
 
-from config import REPORT_DIR, IOC_EXPORT_DIR
+from config import REPORT_DIR, IOC_EXPORT_DIR, JSON_REPORT_PRETTY
 from ui.ui import display_status, display_warning
 
+# OPTIONAL: FAST C JSON ENCODER
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ==================== IOC EXTRACTION ====================
 
 class IOCExtractor:
@@ -23,35 +29,34 @@ class IOCExtractor:
 
     @staticmethod
     def extract_iocs(alerts):
-        iocs = {
-            "IPS": set(),
-            "USERS": set(),
-            "DOMAINS": set(),
-            "HASHES": set(),
-            "TOR_NODES": set()
-        }
+        # Dict keys dedup like a set but keep first-seen order, so feeds
+        # diff cleanly between runs
+        ips, users, tor_nodes = {}, {}, {}
 
         for alert in alerts:
             # SOURCE IP
-            if alert.get("SOURCE_IP"):
-                iocs["IPS"].add(alert["SOURCE_IP"])
+            src = alert.get("SOURCE_IP")
+            if src:
+                ips[src] = None
 
-            # USERNAME
-            if alert.get("USERNAME"):
-                iocs["USERS"].add(alert["USERNAME"])
+                # TOR DETECTION FROM THREAT INTEL — only matters with an IP
+                for intel in alert.get("THREAT_INTEL") or ():
+                    if "TOR" in intel:
+                        tor_nodes[src] = None
+                        break
 
-            # TOR DETECTION FROM THREAT INTEL
-            for intel in alert.get("THREAT_INTEL", []):
-                if "TOR" in intel:
-                    if alert.get("SOURCE_IP"):
-                        iocs["TOR_NODES"].add(alert["SOURCE_IP"])
+            # USERNAME
+            user = alert.get("USERNAME")
+            if user:
+                users[user] = None
 
+        # No domain / hash sources yet — those feeds stay empty
         return {
-            "IPS": list(iocs["IPS"]),
-            "USERS": list(iocs["USERS"]),
-            "DOMAINS": list(iocs["DOMAINS"]),
-            "HASHES": list(iocs["HASHES"]),
-            "TOR_NODES": list(iocs["TOR_NODES"]),
+            "IPS": list(ips),
+            "USERS": list(users),
+            "DOMAINS": [],
+            "HASHES": [],
+            "TOR_NODES": list(tor_nodes),
             "GENERATED_AT": datetime.now().isoformat()
         }
 
@@ -65,6 +70,41 @@ def json_safe(obj):
 
 
 
+def _stream_orjson(f, report, pretty=False):
+    """
+    WRITE A REPORT MAPPING PIECE BY PIECE (LISTS ONE ITEM AT A TIME)
+    BYTE-IDENTICAL TO ONE orjson.dumps, WITHOUT HOLDING IT ALL
+    """
+    dumps = orjson.dumps
+    option = orjson.OPT_NON_STR_KEYS
+
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+        start, sep, colon, end = b"{\n  ", b",\n  ", b": ", b"\n}"
+        item_start, item_sep, item_end = b"[\n    ", b",\n    ", b"\n  ]"
+    else:
+        start, sep, colon, end = b"{", b",", b":", b"}"
+        item_start, item_sep, item_end = b"[", b",", b"]"
+
+    for key, value in report.items():
+        f.write(start + dumps(key) + colon)
+        start = sep
+
+        if isinstance(value, list) and value:
+            for item in value:
+                data = dumps(item, default=json_safe, option=option)
+                f.write(item_start + (
+                    data.replace(b"\n", b"\n    ") if pretty else data
+                ))
+                item_start = item_sep
+            f.write(item_end)
+        else:
+            data = dumps(value, default=json_safe, option=option)
+            f.write(data.replace(b"\n", b"\n  ") if pretty else data)
+
+    f.write(end if report else b"{}")
+
+
 # ==================== REPORT GENERATOR ====================
 
 class ReportGenerator:
@@ -108,8 +148,16 @@ class ReportGenerator:
             f"ELITE_REPORT_{report_id}.json"
         )
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, default=json_safe)
+        # Both paths stream: json.dump writes encoder chunks as it goes
+        if orjson is not None:
+            with open(path, "wb", buffering=1 << 20) as f:
+                _stream_orjson(f, report, pretty=JSON_REPORT_PRETTY)
+        elif JSON_REPORT_PRETTY:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, default=json_safe)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, separators=(",", ":"), default=json_safe)
 
         display_status(f"JSON REPORT GENERATED: {path}")
 
@@ -123,24 +171,24 @@ class ReportGenerator:
         fields = set()
         for alert in alerts:
             for k, v in alert.items():
-                if not isinstance(v, (dict, list)):
+                if k not in fields and not isinstance(v, (dict, list)):
                     fields.add(k)
+        fields = sorted(fields)
 
         path = os.path.join(
             REPORT_DIR,
             f"ELITE_REPORT_{report_id}.csv"
         )
 
+        # Rows built column-ordered up front so csv writes them in one
+        # C-level writerows call instead of DictWriter's per-row dispatch
         with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=sorted(fields),
-                extrasaction="ignore"
+            writer = csv.writer(f)
+            writer.writerow(fields)
+            writer.writerows(
+                [alert.get(k, "") for k in fields]
+                for alert in alerts
             )
-            writer.writeheader()
-
-            for alert in alerts:
-                writer.writerow(alert)
 
         display_status(f"CSV REPORT GENERATED: {path}")
 
@@ -154,7 +202,11 @@ class ReportGenerator:
             f"IOCS_{report_id}.json"
         )
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(iocs, f, indent=2)
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(iocs, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(iocs, f, indent=2)
 
         display_status(f"IOC FEED EXPORTED: {path}")
\ No newline at end of file
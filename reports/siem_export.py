@@ -11,21 +11,29 @@ from datetime import datetime, timezone
 from config import REPORT_DIR
 from ui.ui import display_status
 
+# OPTIONAL: FAST C JSON ENCODER
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ==================== HELPERS ====================
 
 def utc_now():
     return datetime.now(timezone.utc).isoformat()
 
+_SEVERITY_SCALE = {
+    "CRITICAL": 9,
+    "HIGH": 7,
+    "MEDIUM": 5,
+    "LOW": 3
+}
+
 def severity_to_numeric(level):
     """
     Normalize severity to SIEM scale (0–10)
     """
-    return {
-        "CRITICAL": 9,
-        "HIGH": 7,
-        "MEDIUM": 5,
-        "LOW": 3
-    }.get(level, 1)
+    return _SEVERITY_SCALE.get(level, 1)
 
 # ==================== SIEM EXPORT ====================
 
@@ -46,57 +54,95 @@ class SIEMExporter:
             f"SIEM_EVENTS_{report_id}.ndjson"
         )
 
-        with open(siem_file, "w", encoding="utf-8") as f:
-            for alert in alerts:
-                event = self._normalize(alert, report_id)
-                f.write(json.dumps(event) + "\n")
+        # One creation stamp for the whole export batch
+        created = utc_now()
+
+        # 1 MiB buffer — one write syscall per many events
+        if orjson is not None:
+            with open(siem_file, "wb", buffering=1 << 20) as f:
+                for alert in alerts:
+                    event = self._normalize(alert, report_id, created)
+                    f.write(orjson.dumps(event, default=str) + b"\n")
+        else:
+            with open(siem_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+                for alert in alerts:
+                    event = self._normalize(alert, report_id, created)
+                    f.write(json.dumps(event, default=str) + "\n")
 
         display_status(f"SIEM EXPORT GENERATED: {siem_file}")
         return siem_file
 
     # ==================== NORMALIZATION ====================
 
-    def _normalize(self, alert, report_id):
+    # Every key in output order — constants filled in, the rest set per alert.
+    # Assigning into a copy keeps this order and beats a 25-key literal.
+    _TEMPLATE = {
+        # Core SIEM fields
+        "event.id": None,
+        "event.kind": "alert",
+        "event.category": None,
+        "event.type": None,
+        "event.severity": None,
+        "event.risk_score": None,
+        "event.confidence": None,
+        "event.created": None,
+        "event.dataset": "elite_soc",
+
+        # Source / user
+        "source.ip": None,
+        "user.name": None,
+
+        # Geo
+        "source.geo.country_name": None,
+
+        # MITRE ATT&CK (flattened for SIEM)
+        "threat.framework": "MITRE ATT&CK",
+        "threat.tactic.name": None,
+        "threat.technique.id": None,
+        "threat.technique.name": None,
+
+        # ML
+        "ml.anomaly_score": None,
+
+        # Tool metadata
+        "observer.vendor": "ELITE_SOC",
+        "observer.type": "SOC_ANALYZER",
+        "observer.version": None,
+        "report.id": None,
+
+        # Raw enrichment
+        "threat.intel": None,
+        "first_seen": None,
+        "last_seen": None
+    }
+
+    def _normalize(self, alert, report_id, created=None):
         mitre = alert.get("MITRE_ATTACK", {})
-
-        return {
-            # Core SIEM fields
-            "event.id": alert.get("ALERT_ID", str(uuid.uuid4())),
-            "event.kind": "alert",
-            "event.category": alert.get("CATEGORY", "security"),
-            "event.type": alert.get("THREAT_TYPE", "unknown"),
-            "event.severity": severity_to_numeric(
-                alert.get("THREAT_LEVEL")
-            ),
-            "event.risk_score": alert.get("RISK_SCORE", 0),
-            "event.confidence": alert.get("CONFIDENCE", 0),
-            "event.created": utc_now(),
-            "event.dataset": "elite_soc",
-
-            # Source / user
-            "source.ip": alert.get("SOURCE_IP"),
-            "user.name": alert.get("USERNAME"),
-
-            # Geo
-            "source.geo.country_name": alert.get("GEO_COUNTRY"),
-
-            # MITRE ATT&CK (flattened for SIEM)
-            "threat.framework": "MITRE ATT&CK",
-            "threat.tactic.name": mitre.get("TACTIC"),
-            "threat.technique.id": mitre.get("TECHNIQUE"),
-            "threat.technique.name": mitre.get("TECHNIQUE_NAME"),
-
-            # ML
-            "ml.anomaly_score": alert.get("ML_ANOMALY_SCORE"),
-
-            # Tool metadata
-            "observer.vendor": "ELITE_SOC",
-            "observer.type": "SOC_ANALYZER",
-            "observer.version": alert.get("TOOL_VERSION"),
-            "report.id": report_id,
-
-            # Raw enrichment
-            "threat.intel": alert.get("THREAT_INTEL", []),
-            "first_seen": alert.get("FIRST_SEEN"),
-            "last_seen": alert.get("LAST_SEEN")
-        }
\ No newline at end of file
+        get = alert.get
+
+        # Only alerts missing an ID pay for a fresh UUID
+        event_id = get("ALERT_ID")
+        if event_id is None and "ALERT_ID" not in alert:
+            event_id = str(uuid.uuid4())
+
+        event = self._TEMPLATE.copy()
+        event["event.id"] = event_id
+        event["event.category"] = get("CATEGORY", "security")
+        event["event.type"] = get("THREAT_TYPE", "unknown")
+        event["event.severity"] = _SEVERITY_SCALE.get(get("THREAT_LEVEL"), 1)
+        event["event.risk_score"] = get("RISK_SCORE", 0)
+        event["event.confidence"] = get("CONFIDENCE", 0)
+        event["event.created"] = created or utc_now()
+        event["source.ip"] = get("SOURCE_IP")
+        event["user.name"] = get("USERNAME")
+        event["source.geo.country_name"] = get("GEO_COUNTRY")
+        event["threat.tactic.name"] = mitre.get("TACTIC")
+        event["threat.technique.id"] = mitre.get("TECHNIQUE")
+        event["threat.technique.name"] = mitre.get("TECHNIQUE_NAME")
+        event["ml.anomaly_score"] = get("ML_ANOMALY_SCORE")
+        event["observer.version"] = get("TOOL_VERSION")
+        event["report.id"] = report_id
+        event["threat.intel"] = get("THREAT_INTEL", [])
+        event["first_seen"] = get("FIRST_SEEN")
+        event["last_seen"] = get("LAST_SEEN")
+        return event
\ No newline at end of file
@@ -3,75 +3,214 @@
 # AUTHOR: VISHAL — SOC ENGINEERING
 # =====================================================
 
+import atexit
 import sqlite3
-from datetime import datetime
+import threading
+import time
+import weakref
+from pathlib import Path
 from typing import Optional, List, Dict
 
+from utils.clock import now_iso
+
 DB_PATH = "soc.db"
 
+# Database files already switched to WAL — the mode persists in the file
+_wal_paths = set()
+
+# Cached reader + writer connections per thread — closed when their
+# thread ends, and any still open at exit
+_tls = threading.local()
+_open_conns = {}
+_open_conns_lock = threading.Lock()
+
+# SQLite allows one writer at a time — queue writers here instead of
+# inside SQLite's busy handler, so readers never wait behind them
+_write_lock = threading.Lock()
+
+# Short-lived read results, keyed with the write version they were read at
+_CACHE_TTL = 1.0
+_cache = {}
+_write_version = 0
+
 
 # ==================== CONNECTION ====================
 
-def _connect():
+def _connect(readonly=False):
     """
     Create SQLite connection with safe settings
     """
-    return sqlite3.connect(
-        DB_PATH,
-        detect_types=sqlite3.PARSE_DECLTYPES,
-        check_same_thread=False
-    )
+    # Autocommit by default; batched writes open their own transaction
+    if readonly:
+        conn = sqlite3.connect(
+            Path(DB_PATH).resolve().as_uri() + "?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            isolation_level=None
+        )
+    else:
+        conn = sqlite3.connect(
+            DB_PATH,
+            check_same_thread=False,
+            isolation_level=None
+        )
+
+        if DB_PATH not in _wal_paths:
+            conn.execute("PRAGMA journal_mode=WAL")
+            _wal_paths.add(DB_PATH)
+
+        # WAL makes NORMAL durable across app crashes with far fewer fsyncs
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+
+class _ConnSlots:
+    """
+    One thread's cached (DB_PATH, connection) pairs
+    """
+    __slots__ = ("reader", "writer", "__weakref__")
 
+    def __init__(self):
+        self.reader = None
+        self.writer = None
 
-# ==================== INITIALIZATION ====================
 
-def init_db():
+def _release(conn):
+    with _open_conns_lock:
+        if _open_conns.pop(conn, None) is None:
+            return
+    conn.close()
+
+
+def _get_conn(readonly=False):
     """
-    Initialize SOC incident database
+    This thread's reader or writer connection to DB_PATH,
+    opened (and tuned) on first use
     """
-    conn = _connect()
-    cur = conn.cursor()
+    slots = getattr(_tls, "slots", None)
+    if slots is None:
+        slots = _tls.slots = _ConnSlots()
+
+    slot = "reader" if readonly else "writer"
+    cached = getattr(slots, slot)
+    if cached is not None and cached[0] == DB_PATH:
+        return cached[1]
+
+    conn = _connect(readonly)
+    setattr(slots, slot, (DB_PATH, conn))
+    with _open_conns_lock:
+        _open_conns[conn] = readonly
+
+    # The thread-local slots die with their thread — close its
+    # connections then. Exit is left to _close_all, which checkpoints.
+    weakref.finalize(slots, _release, conn).atexit = False
+    return conn
+
+
+@atexit.register
+def _close_all():
+    with _open_conns_lock:
+        # Readers first: only the last connection to close can checkpoint,
+        # and a mode=ro reader can't — the WAL would be left unmerged
+        for conn, readonly in sorted(
+            _open_conns.items(), key=lambda c: not c[1]
+        ):
+            if not readonly:
+                try:
+                    # Refresh planner statistics if the data has shifted enough
+                    conn.execute("PRAGMA optimize")
+                    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                except sqlite3.Error:
+                    pass
+            conn.close()
+        _open_conns.clear()
+
+
+# ==================== READ CACHE ====================
+
+def _invalidate_cache():
+    """
+    Called by every write path once its changes are committed
+    """
+    global _write_version
+    _write_version += 1
+    _cache.clear()
 
-    # INCIDENT TABLE
-    cur.execute("""
-    CREATE TABLE IF NOT EXISTS incidents (
-        alert_id TEXT PRIMARY KEY,
-        threat_type TEXT NOT NULL,
-        severity TEXT NOT NULL,
-        source TEXT,
-        incident_state TEXT DEFAULT 'OPEN',
-        confidence INTEGER,
-        risk_score INTEGER,
-        feedback TEXT,
-        first_seen TEXT,
-        last_seen TEXT,
-        created_at TEXT,
-        updated_at TEXT
-    )
-    """)
 
-    # INDEXES FOR FAST SOC QUERIES
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_state ON incidents (incident_state)")
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_severity ON incidents (severity)")
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_threat ON incidents (threat_type)")
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_updated ON incidents (updated_at)")
+def _cached(key, load):
+    """
+    load() result for key, reused for up to _CACHE_TTL seconds
+    and dropped by the next write in this process
+    """
+    key = (DB_PATH, _write_version) + key
+    now = time.monotonic()
 
-    conn.commit()
-    conn.close()
+    hit = _cache.get(key)
+    if hit is not None and now - hit[0] < _CACHE_TTL:
+        return hit[1]
 
+    value = load()
+    _cache[key] = (now, value)
+    return value
 
-# ==================== UPSERT INCIDENT ====================
 
-def upsert_incident(alert: Dict):
+# ==================== INITIALIZATION ====================
+
+# Column order of the incidents table below — reads name these explicitly
+_INCIDENT_COLUMNS = (
+    "alert_id", "threat_type", "severity", "source",
+    "incident_state", "confidence", "risk_score",
+    "feedback", "first_seen", "last_seen",
+    "created_at", "updated_at"
+)
+
+
+def init_db():
     """
-    Insert or update an incident from alert object
+    Initialize SOC incident database
     """
-    conn = _connect()
-    cur = conn.cursor()
+    with _write_lock:
+        conn = _get_conn()
+        cur = conn.cursor()
+
+        # INCIDENT TABLE
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS incidents (
+            alert_id TEXT PRIMARY KEY,
+            threat_type TEXT NOT NULL,
+            severity TEXT NOT NULL,
+            source TEXT,
+            incident_state TEXT DEFAULT 'OPEN',
+            confidence INTEGER,
+            risk_score INTEGER,
+            feedback TEXT,
+            first_seen TEXT,
+            last_seen TEXT,
+            created_at TEXT,
+            updated_at TEXT
+        )
+        """)
+
+        # INDEXES FOR FAST SOC QUERIES
+        # Filter + ORDER BY updated_at DESC served in index order, no sort step
+        cur.execute("DROP INDEX IF EXISTS idx_state")
+        cur.execute("DROP INDEX IF EXISTS idx_severity")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_state_updated ON incidents (incident_state, updated_at DESC)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_sev_updated ON incidents (severity, updated_at DESC)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_threat ON incidents (threat_type)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_updated ON incidents (updated_at)")
+
+        # Autocommit connection: each statement above is already committed
+        _invalidate_cache()
 
-    now = datetime.utcnow().isoformat()
 
-    cur.execute("""
+# ==================== UPSERT INCIDENT ====================
+
+_UPSERT_SQL = """
     INSERT INTO incidents (
         alert_id, threat_type, severity, source,
         incident_state, confidence, risk_score,
@@ -86,7 +225,11 @@ def upsert_incident(alert: Dict):
         feedback       = excluded.feedback,
         last_seen      = excluded.last_seen,
         updated_at     = excluded.updated_at
-    """, (
+    """
+
+
+def _incident_row(alert: Dict, now: str) -> tuple:
+    return (
         alert.get("ALERT_ID"),
         alert.get("THREAT_TYPE"),
         alert.get("THREAT_LEVEL"),
@@ -99,10 +242,41 @@ def upsert_incident(alert: Dict):
         alert.get("LAST_SEEN"),
         now,
         now
-    ))
+    )
 
-    conn.commit()
-    conn.close()
+
+def upsert_incidents_bulk(alerts: List[Dict]):
+    """
+    Insert or update many incidents in a single transaction
+    """
+    if not alerts:
+        return
+
+    with _write_lock:
+        conn = _get_conn()
+        cur = conn.cursor()
+
+        now = now_iso()
+        cur.execute("BEGIN")
+        try:
+            cur.executemany(
+                _UPSERT_SQL,
+                [_incident_row(alert, now) for alert in alerts]
+            )
+            conn.commit()
+        except BaseException:
+            # The connection outlives this call — never leave it mid-transaction
+            conn.rollback()
+            raise
+
+        _invalidate_cache()
+
+
+def upsert_incident(alert: Dict):
+    """
+    Insert or update an incident from alert object
+    """
+    upsert_incidents_bulk([alert])
 
 
 # ==================== UPDATE INCIDENT STATE ====================
@@ -115,28 +289,46 @@ def update_incident_state(
     """
     Update incident lifecycle state (OPEN / ACK / CLOSED)
     """
-    conn = _connect()
-    cur = conn.cursor()
-
-    cur.execute("""
-    UPDATE incidents
-    SET incident_state = ?,
-        feedback = ?,
-        updated_at = ?
-    WHERE alert_id = ?
-    """, (
-        state,
-        feedback,
-        datetime.utcnow().isoformat(),
-        alert_id
-    ))
-
-    conn.commit()
-    conn.close()
+    with _write_lock:
+        conn = _get_conn()
+        cur = conn.cursor()
+
+        cur.execute("""
+        UPDATE incidents
+        SET incident_state = ?,
+            feedback = ?,
+            updated_at = ?
+        WHERE alert_id = ?
+        """, (
+            state,
+            feedback,
+            now_iso(),
+            alert_id
+        ))
+
+        _invalidate_cache()
 
 
 # ==================== FETCH INCIDENTS ====================
 
+def _select_incidents(by_state: bool, by_severity: bool) -> str:
+    query = f"SELECT {', '.join(_INCIDENT_COLUMNS)} FROM incidents WHERE 1=1"
+    if by_state:
+        query += " AND incident_state = ?"
+    if by_severity:
+        query += " AND severity = ?"
+    return query + " ORDER BY updated_at DESC"
+
+
+# One fixed SQL text per filter combination, so the connection's
+# statement cache reuses the compiled statement instead of re-preparing it
+_GET_SQL = {
+    (by_state, by_severity): _select_incidents(by_state, by_severity)
+    for by_state in (False, True)
+    for by_severity in (False, True)
+}
+
+
 def get_incidents(
     state: Optional[str] = None,
     severity: Optional[str] = None
@@ -144,29 +336,28 @@ def get_incidents(
     """
     Fetch incidents with optional filters
     """
-    conn = _connect()
+    rows = _cached(
+        ("incidents", state, severity),
+        lambda: _fetch_incidents(state, severity)
+    )
+
+    # Copies, so callers can't edit the cached result
+    return [dict(r) for r in rows]
+
+
+def _fetch_incidents(state, severity):
+    conn = _get_conn(readonly=True)
     cur = conn.cursor()
 
-    query = "SELECT * FROM incidents WHERE 1=1"
     params = []
-
     if state:
-        query += " AND incident_state = ?"
         params.append(state)
-
     if severity:
-        query += " AND severity = ?"
         params.append(severity)
 
-    query += " ORDER BY updated_at DESC"
-
-    cur.execute(query, params)
-    rows = cur.fetchall()
-    columns = [d[0] for d in cur.description]
+    cur.execute(_GET_SQL[bool(state), bool(severity)], params)
 
-    conn.close()
-
-    return [dict(zip(columns, r)) for r in rows]
+    return [dict(zip(_INCIDENT_COLUMNS, r)) for r in cur.fetchall()]
 
 
 # ==================== METRICS (SOC KPIs) ====================
@@ -175,18 +366,23 @@ def get_metrics() -> Dict:
     """
     SOC metrics: open incidents, closed, MTTR base
     """
-    conn = _connect()
-    cur = conn.cursor()
+    return dict(_cached(("metrics",), _fetch_metrics))
 
-    cur.execute("SELECT COUNT(*) FROM incidents WHERE incident_state='OPEN'")
-    open_count = cur.fetchone()[0]
 
-    cur.execute("SELECT COUNT(*) FROM incidents WHERE incident_state='CLOSED'")
-    closed_count = cur.fetchone()[0]
+def _fetch_metrics():
+    conn = _get_conn(readonly=True)
+    cur = conn.cursor()
 
-    conn.close()
+    # One covering-index pass over idx_state_updated instead of a COUNT per state
+    cur.execute("""
+    SELECT incident_state, COUNT(*)
+    FROM incidents
+    WHERE incident_state IN ('OPEN', 'CLOSED')
+    GROUP BY incident_state
+    """)
+    counts = dict(cur.fetchall())
 
     return {
-        "OPEN_INCIDENTS": open_count,
-        "CLOSED_INCIDENTS": closed_count
-    }
\ No newline at end of file
+        "OPEN_INCIDENTS": counts.get("OPEN", 0),
+        "CLOSED_INCIDENTS": counts.get("CLOSED", 0)
+    }
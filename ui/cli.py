@@ -15,22 +15,27 @@ One command. One truth.
 
 import argparse
 import json
-from pprint import pprint
+import sys
 
-# Brains
-from brains.attacker.attacker_brain import AttackerBrain
-from brains.defender.defender_brain import DefenderBrain
-from brains.time.time_engine import TimeEngine
+# Optional: fast C JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Core
-from core.intelligence_loop import CoreIntelligenceLoop
 
-# Memory & Evolution
-from memory.experience_memory import ExperienceMemory
-from evolution.self_mutation import SelfMutationEngine
+def _render_report(report, sort_keys=False):
+    """
+    Indented JSON text of the report — orjson when available; values
+    neither encoder knows fall back to str() on both paths
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(report, default=str, option=option).decode()
 
-# Reports
-from reports.future_report import FutureReportEngine
+    return json.dumps(report, indent=2, sort_keys=sort_keys, default=str)
 
 
 def run_full_cycle(verbose=False):
@@ -38,6 +43,15 @@ def run_full_cycle(verbose=False):
     Runs a full intelligence cycle.
     """
 
+    # Imported here so --help and argument errors skip subsystem startup
+    from brains.attacker.attacker_brain import AttackerBrain
+    from brains.defender.defender_brain import DefenderBrain
+    from brains.time.time_engine import TimeEngine
+    from core.intelligence_loop import CoreIntelligenceLoop
+    from memory.experience_memory import ExperienceMemory
+    from evolution.self_mutation import SelfMutationEngine
+    from reports.future_report import FutureReportEngine
+
     print("\n[+] Initializing Living Security Intelligence System...\n")
 
     # Initialize components
@@ -105,10 +119,8 @@ def run_full_cycle(verbose=False):
 
     print("\n[✓] FUTURE INTELLIGENCE REPORT GENERATED\n")
 
-    if verbose:
-        pprint(report)
-    else:
-        print(json.dumps(report, indent=2))
+    # Verbose keeps pprint's sorted key order
+    sys.stdout.write(_render_report(report, sort_keys=verbose) + "\n")
 
     print("\n[✓] SYSTEM STATUS:")
     print("- Cycles completed:", core.memory_snapshot()["cycles_completed"])
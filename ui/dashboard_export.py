@@ -3,32 +3,47 @@ import json
 import os
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def _json_safe(obj):
     if isinstance(obj, datetime):
         return obj.isoformat()
     return str(obj)
 
+def _write_json(path, data, compact=False):
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, default=_json_safe, option=option))
+    elif compact:
+        with open(path, "w") as f:
+            json.dump(data, f, separators=(",", ":"), default=_json_safe)
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2, default=_json_safe)
+
 def export_dashboard_data(alerts, stats):
     os.makedirs("ui/web/data", exist_ok=True)
 
+    # One pass fills dashboard defaults and builds the timelines together
+    now = datetime.now()
+    timelines = {}
     for a in alerts:
         a.setdefault("INCIDENT_STATE", "OPEN")
         a.setdefault("ASSIGNED_TO", None)
-        a.setdefault("LAST_UPDATED", datetime.now())
-
-    with open("ui/web/data/alerts.json", "w") as f:
-        json.dump(alerts, f, indent=2, default=_json_safe)
+        a.setdefault("LAST_UPDATED", now)
 
-    with open("ui/web/data/stats.json", "w") as f:
-        json.dump(stats, f, indent=2, default=_json_safe)
-
-    timelines = {}
-    for a in alerts:
-        iid = a.get("ALERT_ID")
-        timelines[iid] = [
+        timelines[a.get("ALERT_ID")] = [
             {"time": a.get("FIRST_SEEN"), "event": "first_seen"},
             {"time": a.get("LAST_SEEN"), "event": "last_seen"}
         ]
 
-    with open("ui/web/data/timelines.json", "w") as f:
-        json.dump(timelines, f, indent=2, default=_json_safe)
+    # Only the dashboard reads alerts / timelines — skip the indentation
+    _write_json("ui/web/data/alerts.json", alerts, compact=True)
+    _write_json("ui/web/data/stats.json", stats)
+    _write_json("ui/web/data/timelines.json", timelines, compact=True)
@@ -47,14 +47,21 @@ def display_error(msg):
 
 # ==================== SEVERITY COLORS ====================
 
+_SEVERITY_COLORS = {
+    "CRITICAL": Colors.RED,
+    "HIGH": Colors.MAGENTA,
+    "MEDIUM": Colors.YELLOW,
+    "LOW": Colors.GREEN,
+    "INFO": Colors.CYAN
+}
+
+
 def severity_color(level):
-    return {
-        "CRITICAL": Colors.RED,
-        "HIGH": Colors.MAGENTA,
-        "MEDIUM": Colors.YELLOW,
-        "LOW": Colors.GREEN,
-        "INFO": Colors.CYAN
-    }.get(level.upper(), Colors.WHITE)
+    # Levels are normally uppercase already — only fold case on a miss
+    color = _SEVERITY_COLORS.get(level)
+    if color is None:
+        color = _SEVERITY_COLORS.get(level.upper() if level else "", Colors.WHITE)
+    return color
 
 
 # ==================== ALERT PRINT ====================
@@ -101,23 +108,37 @@ def display_summary(stats):
 
 # ==================== PROGRESS BAR ====================
 
+# No ANSI codes when output is piped to a file
+_ISATTY = sys.stdout.isatty()
+_BAR_PREFIX = "\r" + (Colors.RED if _ISATTY else "")
+_BAR_SUFFIX = Colors.RESET if _ISATTY else ""
+
+
 def progress_bar(current, total, label=""):
     if total <= 0:
         return
 
     percent = int((current / total) * 100)
+    done = current >= total
+
+    # Redraw only when the visible percentage changes
+    if percent == progress_bar.last and not done:
+        return
+    progress_bar.last = -1 if done else percent
+
     filled = percent // 4
     bar = "█" * filled + "-" * (25 - filled)
 
-    sys.stdout.write(
-        f"\r{Colors.RED}{label} [{bar}] {percent}%{Colors.RESET}"
-    )
+    sys.stdout.write(f"{_BAR_PREFIX}{label} [{bar}] {percent}%{_BAR_SUFFIX}")
     sys.stdout.flush()
 
-    if current >= total:
+    if done:
         print()
 
 
+progress_bar.last = -1
+
+
 # ==================== PAUSE ====================
 
 def wait_for_user():
@@ -0,0 +1,21 @@
+# utils/clock.py
+
+import time
+from datetime import datetime, timezone
+
+# (epoch float, ISO string) — shared by every caller within one window
+_now_cache = (0.0, "")
+
+
+def now_iso():
+    """
+    UTC ISO-8601 timestamp with microseconds, rebuilt at most every 100 ms
+    """
+    global _now_cache
+
+    now = time.time()
+    if not 0.0 <= now - _now_cache[0] < 0.1:
+        stamp = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None)
+        _now_cache = (now, stamp.isoformat(timespec="microseconds"))
+
+    return _now_cache[1]
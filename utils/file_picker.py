@@ -18,6 +18,35 @@ def get_default_root():
         return "/storage/emulated/0"
     return os.getcwd()
 
+# ==================== DIRECTORY SCAN ====================
+
+def _scan_files(base_dir, max_depth, match):
+    """
+    Depth-limited walk yielding file DirEntry objects whose name passes
+    match() — same top-down order as os.walk, without its per-directory
+    name lists or the depth string slicing
+    """
+    stack = [(base_dir, 0)]
+
+    while stack:
+        path, depth = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if depth < max_depth:
+                    subdirs.append((entry.path, depth + 1))
+            elif match(entry.name) and entry.is_file():
+                yield entry
+
+        # Reversed so the first subdirectory is walked next
+        stack.extend(reversed(subdirs))
+
 # ==================== SMART SEARCH ====================
 
 def smart_file_search(filename, base_dir=None, max_depth=4):
@@ -27,19 +56,12 @@ def smart_file_search(filename, base_dir=None, max_depth=4):
     if base_dir is None:
         base_dir = get_default_root()
 
-    matches = []
-
-    for root, dirs, files in os.walk(base_dir):
-        depth = root[len(base_dir):].count(os.sep)
-        if depth > max_depth:
-            dirs[:] = []
-            continue
-
-        for f in files:
-            if f.lower() == filename.lower():
-                matches.append(os.path.join(root, f))
+    target = filename.lower()
 
-    return matches
+    return [
+        entry.path
+        for entry in _scan_files(base_dir, max_depth, lambda n: n.lower() == target)
+    ]
 
 # ==================== LOG FILE PICKER ====================
 
@@ -50,25 +72,19 @@ def file_picker_logs(base_dir=None, max_depth=3):
     if base_dir is None:
         base_dir = get_default_root()
 
-    log_files = []
-
-    for root, dirs, files in os.walk(base_dir):
-        depth = root[len(base_dir):].count(os.sep)
-        if depth > max_depth:
-            dirs[:] = []
-            continue
-
-        for f in files:
-            if f.lower().endswith(".log"):
-                log_files.append(os.path.join(root, f))
+    # (path, size) — the size comes from the same DirEntry, no extra stat
+    log_files = [
+        (entry.path, entry.stat().st_size)
+        for entry in _scan_files(base_dir, max_depth, lambda n: n[-4:].lower() == ".log")
+    ]
 
     if not log_files:
         display_warning("NO LOG FILES FOUND")
         return None
 
     print("\n📁 LOG FILE PICKER\n")
-    for i, path in enumerate(log_files, 1):
-        size_kb = os.path.getsize(path) // 1024
+    for i, (path, size) in enumerate(log_files, 1):
+        size_kb = size // 1024
         short = path.replace(base_dir + os.sep, "")
         print(f"[{i}] {short} ({size_kb} KB)")
 
@@ -84,7 +100,7 @@ def file_picker_logs(base_dir=None, max_depth=3):
         return None
 
     if 1 <= choice <= len(log_files):
-        return log_files[choice - 1]
+        return log_files[choice - 1][0]
 
     display_warning("INVALID SELECTION")
     return None
@@ -97,25 +113,30 @@ def paste_log_data():
     """
     print("\n📋 PASTE LOG DATA — TYPE 'END' TO FINISH\n")
 
-    lines = []
-    while True:
-        try:
-            line = input()
-        except KeyboardInterrupt:
-            break
+    # Lines go straight to disk instead of piling up in memory
+    temp = f"._SOC_TEMP_{int(time.time())}.log"
+    has_any = False
 
-        if line.strip() == "END":
-            break
-        lines.append(line)
+    with open(temp, "w", encoding="utf-8", buffering=1 << 20) as f:
+        while True:
+            try:
+                line = input()
+            except (KeyboardInterrupt, EOFError):
+                break
 
-    if not lines:
+            if line.strip() == "END":
+                break
+
+            if has_any:
+                f.write("\n")
+            f.write(line)
+            has_any = True
+
+    if not has_any:
+        os.remove(temp)
         display_warning("NO LOG DATA PROVIDED")
         return None
 
-    temp = f"._SOC_TEMP_{int(time.time())}.log"
-    with open(temp, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-
     display_status(f"TEMP LOG CREATED: {temp}")
     return temp
 
@@ -1,13 +1,20 @@
 # utils/log_loader.py
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-def load_logs(logs_path):
-    logs_data = {}
 
-    for file in os.listdir(logs_path):
-        if file.endswith(".log"):
-            with open(os.path.join(logs_path, file), "r") as f:
-                logs_data[file] = f.readlines()
+def _read_lines(path):
+    with open(path, "r") as f:
+        return f.readlines()
+
+
+def load_logs(logs_path):
+    files = [file for file in os.listdir(logs_path) if file.endswith(".log")]
+    if not files:
+        return {}
 
-    return logs_data
\ No newline at end of file
+    # File reads release the GIL — overlap them instead of waiting on each
+    paths = [os.path.join(logs_path, file) for file in files]
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+        return dict(zip(files, pool.map(_read_lines, paths)))